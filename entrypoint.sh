@@ -1,6 +1,6 @@
 #!/bin/bash
 
-OUTPUT_NAME="transation-tracks"
+OUTPUT_NAME="translation-tracks"
 
 cmd="python /usr/src/app/main.py"
 
@@ -40,6 +40,9 @@ arg_projectcardinitializetemplate=${33}  # 33) project-card-initialize-template
 arg_projectcardupdatetemplate=${34}  # 34) project-card-update-template
 arg_projectcarduptodatetemplate=${35}  # 35) project-card-uptodate-template
 arg_projectcardorphantemplate=${36}  # 36) project-card-orphan-template
+arg_runcache=${37}  # 37) run-cache
+arg_trackercache=${38}  # 38) tracker-cache
+arg_githubcache=${39}  # 39) github-cache
 
 # build arguments for script
 # set optional arguments
@@ -47,6 +50,8 @@ arg_projectcardorphantemplate=${36}  # 36) project-card-orphan-template
 [ -n "$arg_repopath" ] && args="$args -r \"$arg_repopath\""
 [ -n "$arg_filters" ] && args="$args --filter \"${arg_filters//$'\n'/\" \"}\""
 [ -n "$arg_ignores" ] && args="$args --ignore \"${arg_ignores//$'\n'/\" \"}\""
+[ -n "$arg_trackercache" ] && args="$args --tracker-cache \"$arg_trackercache\""
+[ -n "$arg_runcache" ] && args="$args --run-cache \"$arg_runcache\""
 [ -n "$arg_genstubs" ] && args="$args --gen-stubs \"${arg_genstubs//$'\n'/\" \"}\""
 [ -n "$arg_stubcommit" ] && args="$args --stub-commit \"$arg_stubcommit\""
 [ -n "$arg_stubtemplate" ] && args="$args --stub-template \"$arg_stubtemplate\""
@@ -54,6 +59,7 @@ arg_projectcardorphantemplate=${36}  # 36) project-card-orphan-template
 [ -n "$arg_copycommit" ] && args="$args --copy-commit \"$arg_copycommit\""
 [ -n "$arg_genbranch" ] && args="$args --gen-branch \"$arg_genbranch\""
 [ -n "$arg_repository" ] && [ -n "$arg_token" ] && args="$args --github \"$arg_repository\" \"$arg_token\""
+[ -n "$arg_githubcache" ] && args="$args --github-cache \"$arg_githubcache\""
 if [ "$arg_requestmerge" == "true" ] || [ "$arg_requestmerge" == "1" ]; then
     args="$args --request-merge"  # request-merge
 fi
@@ -79,6 +85,10 @@ fi
 [ -n "$arg_projectcarduptodatetemplate" ] && args="$args --project-card-uptodate-template \"$arg_projectcarduptodatetemplate\""
 [ -n "$arg_projectcardorphantemplate" ] && args="$args --project-card-orphan-template \"$arg_projectcardorphantemplate\""
 
+# write result to a file rather than capturing it in memory
+result_file=$(mktemp)
+args="$args -o \"$result_file\""
+
 # set positional arguments
 args="$args \"$arg_original\""
 args="$args \"${arg_translations//$'\n'/\" \"}\""
@@ -87,11 +97,21 @@ cmdargs="$cmd$args"
 
 echo $cmdargs
 
-result=$(sh -c "$cmdargs")
+sh -c "$cmdargs"
 
 if [ $? != 0 ]; then
     echo "::error:: Script failure, check logs"
     exit 1
 fi
 
-echo "::set-output name=${OUTPUT_NAME}::${result}"
+if [ -n "$GITHUB_OUTPUT" ]; then
+    # multiline syntax, the result being a single JSON line
+    {
+        echo "${OUTPUT_NAME}<<WUT_OUTPUT_EOF"
+        cat "$result_file"
+        echo
+        echo "WUT_OUTPUT_EOF"
+    } >> "$GITHUB_OUTPUT"
+else
+    echo "::set-output name=${OUTPUT_NAME}::$(cat "$result_file")"
+fi
@@ -0,0 +1,27 @@
+import os
+import json
+import tempfile
+
+
+def write_json(path, data):
+    """
+    Writes data as compact JSON to a file atomically: it's written to a temporary file in the same directory, then renamed over ``path``.
+
+    An interrupted run never leaves a truncated file behind, which the next run would have to discard.
+
+    :param pathlib.Path path: the file to write
+    :param data: JSON serializable data
+    :raise OSError: when the file can't be written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".{}.".format(os.path.basename(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,11 +1,13 @@
 import logging as log
-from pathlib import Path
-from os import makedirs
+from io import BytesIO
 import fnmatch
 from git import (
     Repo,
-    Actor
+    Actor,
+    Blob
 )
+from git.index.typ import BaseIndexEntry
+from gitdb import IStream
 from tracker import (
     TranslationGitFile,
     TranslationTrack,
@@ -32,6 +34,12 @@ def translation_fnmatch(track, filters):
     return False
 
 
+# git mode of generated files, regular non-executable files
+FILE_MODE = 0o100644
+# maximum number of paths given to a single git checkout-index command
+CHECKOUT_PATHS_CHUNK = 1000
+
+
 class GitUpdater:
     """
     Update git files on the repo according to tracked files.
@@ -89,6 +97,18 @@ class GitUpdater:
             log.debug("Checking out branch '{}'".format(branch_name))
             new_branch.checkout()
 
+    def add_entries(self, entries):
+        """
+        Adds files to the index from blobs already in the git object database, then writes them in the working tree.
+
+        :param entries: index entries of the files, with blobs stored in the repo
+        :type entries: list(git.index.typ.BaseIndexEntry)
+        """
+        self.repo.index.add(entries)
+        paths = [entry.path for entry in entries]
+        for i in range(0, len(paths), CHECKOUT_PATHS_CHUNK):
+            self.repo.git.checkout_index('--force', '--', *paths[i:i + CHECKOUT_PATHS_CHUNK])
+
     def create_stubs(self, commit_msg, stub_template, filters=['*']):
         """
         Creates stub translation files for To Create translation tracks in registered tracks whose translation filename matches one of the filters.
@@ -103,27 +123,23 @@ class GitUpdater:
         :rtype: list(tracker.TranslationTrack)
         :raise RuntimeError: when tracks changed because of an external source after committing
         """
-        indexes = []
-        paths = []
-        for i in range(len(self.tracks)):
-            track = self.tracks[i]
+        generated = []
+        entries = []
+        for i, track in enumerate(self.tracks):
             if isinstance(track, ToCreateTranslationTrack) and translation_fnmatch(track, filters):
                 log.debug("Generating stub translation file {}".format(track.translation.path))
-                paths.append(track.translation.path.as_posix())
-                indexes.append(i)
+                generated.append((i, track))
 
                 # format content with relative path to original file (from translation file directory)
-                content = stub_template.format(track)
+                content = stub_template.format(track).encode('utf-8')
 
-                # create dirs and file
-                filepath = Path(self.repo.working_tree_dir) / track.translation.path
-                makedirs(filepath.parent, exist_ok=True)
-                with open(filepath, 'w') as f:
-                    f.write(content)
+                # store content in git objects directly
+                istream = self.repo.odb.store(IStream(Blob.type, len(content), BytesIO(content)))
+                entries.append(BaseIndexEntry((FILE_MODE, istream.binsha, 0, track.translation.path.as_posix())))
 
-        if len(paths) > 0:
-            # add to index
-            self.repo.index.add(paths)
+        if len(entries) > 0:
+            # add to index and working tree
+            self.add_entries(entries)
             # git commit
             log.debug("Committing created stub files")
             commit = self.repo.index.commit(commit_msg, author=self.author, committer=self.committer)
@@ -131,12 +147,14 @@ class GitUpdater:
             self.commits.append(commit)
 
             # udpate To Create tracks to To Initialize
-            for i in indexes:
-                track = self.tracks[i]
-                if not (isinstance(track, ToCreateTranslationTrack) and translation_fnmatch(track, filters)):
+            branch_name = self.repo.active_branch.name
+            # the new commit is the last change of every generated file, no need to look for it
+            history = {track.translation.path.as_posix(): commit.hexsha for i, track in generated}
+            for i, track in generated:
+                if self.tracks[i] is not track:
                     raise RuntimeError("potential race condition detected, ensure you use everything sequentially")
-                new_translation = TranslationGitFile(track.translation.path, track.translation.lang_tag, commit)
-                new_track = ToInitTranslationTrack(new_translation, track.original, self.repo.active_branch.name)
+                new_translation = TranslationGitFile(track.translation.path, track.translation.lang_tag, commit, history=history)
+                new_track = ToInitTranslationTrack(new_translation, track.original, branch_name)
                 self.tracks[i] = new_track
 
         return self.tracks
@@ -154,27 +172,19 @@ class GitUpdater:
         :rtype: list(tracker.TranslationTrack)
         :raise RuntimeError: when tracks changed because of an external source after committing
         """
-        indexes = []
-        paths = []
-        for i in range(len(self.tracks)):
-            track = self.tracks[i]
+        generated = []
+        entries = []
+        for i, track in enumerate(self.tracks):
             if isinstance(track, ToCreateTranslationTrack) and translation_fnmatch(track, filters):
                 log.debug("Creating copy from original file to translation file {}".format(track.translation.path))
-                paths.append(track.translation.path.as_posix())
-                indexes.append(i)
-
-                # get content from original file
-                content = track.original.blob.data_stream.read()
+                generated.append((i, track))
 
-                # create dirs and translation file
-                filepath = Path(self.repo.working_tree_dir) / track.translation.path
-                makedirs(filepath.parent, exist_ok=True)
-                with open(filepath, 'wb') as f:
-                    f.write(content)
+                # the copy has the same content, hence the same blob, as the original file
+                entries.append(BaseIndexEntry((FILE_MODE, track.original.blob.binsha, 0, track.translation.path.as_posix())))
 
-        if len(paths) > 0:
-            # add to index
-            self.repo.index.add(paths)
+        if len(entries) > 0:
+            # add to index and working tree
+            self.add_entries(entries)
             # git commit
             log.debug("Committing created stub files")
             commit = self.repo.index.commit(commit_msg, author=self.author, committer=self.committer)
@@ -182,12 +192,14 @@ class GitUpdater:
             self.commits.append(commit)
 
             # update To Create tracks to Up-To-Date
-            for i in indexes:
-                track = self.tracks[i]
-                if not (isinstance(track, ToCreateTranslationTrack) and translation_fnmatch(track, filters)):
+            branch_name = self.repo.active_branch.name
+            # the new commit is the last change of every generated file, no need to look for it
+            history = {track.translation.path.as_posix(): commit.hexsha for i, track in generated}
+            for i, track in generated:
+                if self.tracks[i] is not track:
                     raise RuntimeError("potential race condition detected, ensure you use everything sequentially")
-                new_translation = TranslationGitFile(track.translation.path, track.translation.lang_tag, commit)
-                new_track = UpToDateTranslationTrack(new_translation, track.original, self.repo.active_branch.name)
+                new_translation = TranslationGitFile(track.translation.path, track.translation.lang_tag, commit, history=history)
+                new_track = UpToDateTranslationTrack(new_translation, track.original, branch_name)
                 self.tracks[i] = new_track
 
         return self.tracks
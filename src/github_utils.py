@@ -1,6 +1,22 @@
 from constants import GITHUB_URL
+from file_utils import write_json
+import logging as log
+import threading
+import time
+import json
+import hashlib
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from github import GithubException
+from github.Requester import (
+    Requester,
+    RequestsResponse
+)
 
 
+@lru_cache(maxsize=8192)
 def file_url(repo_name, rev, path):
     """
     Forges Github URL to a blob in a repo (through branch or commit rev).
@@ -14,6 +30,7 @@ def file_url(repo_name, rev, path):
     return "{}/{}/blob/{}/{}".format(GITHUB_URL, repo_name, rev, path)
 
 
+@lru_cache(maxsize=8192)
 def raw_file_url(repo_name, rev, path):
     """
     Forges Github URL to a blob raw content in a repo (through branch or commit rev).
@@ -27,6 +44,7 @@ def raw_file_url(repo_name, rev, path):
     return "{}/{}/raw/{}/{}".format(GITHUB_URL, repo_name, rev, path)
 
 
+@lru_cache(maxsize=8192)
 def compare_url(repo_name, rev_a, rev_b):
     """
     Forges Github URL to compare rev_a to rev_b with link to files comparison.
@@ -38,3 +56,333 @@ def compare_url(repo_name, rev_a, rev_b):
     :rtype: str
     """
     return "{}/{}/compare/{}...{}#files_bucket".format(GITHUB_URL, repo_name, rev_a, rev_b)
+
+
+def pooled_session(pool_size=16, retries=3):
+    """
+    Creates a HTTP session keeping up to ``pool_size`` connections alive per host, for threads to reuse them instead of opening a TLS connection per request.
+
+    Idempotent requests failing to connect, or answered by a GitHub gateway error (502, 503, 504), are retried with an exponential backoff.
+
+    :param int pool_size: maximum number of connections kept alive per host, at least the number of threads making requests
+    :param int retries: maximum number of retries of a request
+    :return: the session
+    :rtype: requests.Session
+    """
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class ResponseCache:
+    """
+    Cache of GitHub API GET responses validated by their ETag, which can be kept between runs in a JSON file.
+
+    A cached response is revalidated with a conditional request: GitHub answers "304 Not Modified" without counting it in the rate limit when the resource didn't change.
+    Keys depend on the credentials, so responses are only reused by runs with the same token.
+
+    :var dict entries: cached responses as {key: {"etag": etag, "headers": headers, "body": body}}
+    :var set used: keys of the entries read or stored during this run, the only ones saved
+    """
+    def __init__(self):
+        self.entries = {}
+        self.used = set()
+
+    def key(self, url, headers):
+        """
+        Gives the cache key of a request, depending on the URL, accepted media type and credentials (hashed).
+
+        :param str url: the requested URL
+        :param dict headers: the request headers
+        :return: the key
+        :rtype: str
+        """
+        auth = hashlib.sha256(headers.get("Authorization", "").encode("utf-8")).hexdigest()
+        return "{} {} {}".format(auth, headers.get("Accept", ""), url)
+
+    def get(self, key):
+        """
+        :param str key: the request key
+        :return: the cached response, None if not cached
+        :rtype: dict or None
+        """
+        cached = self.entries.get(key)
+        if cached is not None:
+            self.used.add(key)
+        return cached
+
+    def put(self, key, etag, headers, body):
+        """
+        Caches a response.
+
+        :param str key: the request key
+        :param str etag: the response ETag
+        :param dict headers: the response headers
+        :param str body: the response body
+        """
+        self.entries[key] = {
+            "etag": etag,
+            "headers": headers,
+            "body": body
+        }
+        self.used.add(key)
+
+    def load(self, path):
+        """
+        Loads responses cached in a file by a previous run. An unreadable or invalid file is ignored.
+
+        :param pathlib.Path path: the cache file
+        """
+        try:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            log.debug("No usable GitHub cache in {}: {}".format(path, e))
+            return
+        if isinstance(entries, dict):
+            self.entries.update(entries)
+
+    def save(self, path):
+        """
+        Saves responses read or stored during this run to a file for next runs, dropping entries left over by older runs (e.g. with another token).
+
+        :param pathlib.Path path: the cache file
+        """
+        try:
+            write_json(path, {key: self.entries[key] for key in self.used if key in self.entries})
+        except OSError as e:
+            log.warning("Couldn't write GitHub cache to {}.".format(path))
+            log.debug("Got error: {}".format(e))
+
+
+class CachedResponse:
+    """
+    Response to a request answered by GitHub as not modified, mimicking ``github.Requester.RequestsResponse``.
+    """
+    def __init__(self, cached, headers):
+        """
+        :param dict cached: the cached response (see ``ResponseCache``)
+        :param headers: the "304 Not Modified" response headers, updating the cached ones (e.g rate limit)
+        :type headers: dict(str, str)
+        """
+        self.status = 200
+        self.headers = dict(cached["headers"])
+        self.headers.update(headers)
+        self.body = cached["body"]
+
+    def getheaders(self):
+        return self.headers.items()
+
+    def read(self):
+        return self.body
+
+
+# GET responses shared by every connection, see ``SharedSessionConnection``
+response_cache = ResponseCache()
+
+
+class SharedSessionConnection:
+    """
+    HTTPS connection class for PyGithub requests, sending every request through a single shared ``requests.Session``, to be injected with ``use_shared_session``.
+
+    PyGithub default connection object stores a request before sending it, and may be shared by several threads: pending requests are kept per thread here.
+    The session pools keep-alive connections and is safe to use from several threads.
+    GET requests are made conditional on ETags of cached responses, so that unchanged resources are not downloaded again and don't count in the rate limit.
+    GET requests rejected by a rate limit telling when to retry (see ``rate_limit_delay``) are sent again once it's over, instead of failing the job.
+    Writes are not retried here, ``WriteThrottle`` already retries them while holding back every other write.
+
+    :var requests.Session session: the shared session
+    :var ResponseCache cache: the cache of GET responses, None to disable it
+    :var int rate_limit_retries: maximum number of retries of a request rejected by a rate limit
+    :var float max_rate_limit_wait: maximum delay in seconds to wait for a rate limit to be over, longer ones fail the request
+    """
+    session = pooled_session()
+    protocol = "https"
+    default_port = 443
+    pending = threading.local()
+    cache = response_cache
+    rate_limit_retries = 3
+    max_rate_limit_wait = 60.0
+
+    def __init__(self, host, port=None, strict=False, timeout=None, retry=None, **kwargs):
+        self.host = host
+        self.port = port if port else self.default_port
+        self.timeout = timeout
+        self.verify = kwargs.get("verify", True)
+
+    def request(self, verb, url, input, headers):
+        self.pending.request = (verb, url, input, headers)
+
+    def getresponse(self):
+        verb, url, input, headers = self.pending.request
+        url = "{}://{}:{}{}".format(self.protocol, self.host, self.port, url)
+        key = None
+        cached = None
+        if verb == "GET" and self.cache is not None:
+            key = self.cache.key(url, headers)
+            cached = self.cache.get(key)
+            if cached is not None:
+                headers = dict(headers)
+                headers["If-None-Match"] = cached["etag"]
+        attempt = 0
+        while True:
+            r = self.session.request(
+                verb,
+                url,
+                headers=headers,
+                data=input,
+                timeout=self.timeout,
+                verify=self.verify,
+                allow_redirects=False
+            )
+            if verb != "GET":
+                break
+            delay = rate_limit_delay(r, self.max_rate_limit_wait)
+            if delay is None or attempt >= self.rate_limit_retries:
+                break
+            attempt = attempt + 1
+            log.warning("GitHub rate limit reached, retrying in {:.0f} seconds".format(delay))
+            time.sleep(delay)
+        if key is not None:
+            if r.status_code == 304 and cached is not None:
+                return CachedResponse(cached, r.headers)
+            if r.status_code == 200 and "ETag" in r.headers:
+                self.cache.put(key, r.headers["ETag"], dict(r.headers), r.text)
+        return RequestsResponse(r)
+
+    def close(self):
+        return
+
+
+class HTTPSharedSessionConnection(SharedSessionConnection):
+    """
+    HTTP version of ``SharedSessionConnection``.
+    """
+    protocol = "http"
+    default_port = 80
+
+
+def rate_limit_delay(response, max_wait):
+    """
+    Tells how long to wait before retrying a request rejected by a GitHub rate limit, from the ``Retry-After`` header, or from ``X-RateLimit-Reset`` once the primary rate limit is exhausted.
+
+    :param requests.Response response: the response to the request
+    :param float max_wait: maximum delay in seconds worth waiting
+    :return: the delay in seconds, None when the request wasn't rejected by a rate limit, or when the delay is unknown or longer than ``max_wait``
+    :rtype: float or None
+    """
+    if response.status_code not in (403, 429):
+        return None
+    headers = response.headers
+    try:
+        if "Retry-After" in headers:
+            delay = float(headers["Retry-After"])
+        elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+            # reset is a UTC epoch time in seconds, leave a second for clocks skew
+            delay = float(headers["X-RateLimit-Reset"]) - time.time() + 1
+        else:
+            return None
+    except ValueError:
+        # e.g Retry-After as a HTTP date, never sent by GitHub
+        return None
+    if delay > max_wait:
+        return None
+    return max(delay, 0.0)
+
+
+def use_shared_session():
+    """
+    Makes PyGithub send requests through ``SharedSessionConnection``, so that GitHub API calls can be made concurrently from several threads.
+
+    Must be called before any request.
+    """
+    Requester.injectConnectionClasses(HTTPSharedSessionConnection, SharedSessionConnection)
+
+
+class WriteThrottle:
+    """
+    Paces GitHub API write calls (content creations and edits) to stay under GitHub secondary rate limits, shared by every thread.
+
+    Writes are paced like a token bucket: up to ``burst`` writes may go at once, then one every ``interval`` seconds on average, with at most ``max_writes`` in flight.
+    Writes rejected by the secondary rate limit (abuse detection) are retried after an exponential backoff, delaying every other write as well.
+    """
+    def __init__(self, interval=0.2, max_writes=20, retries=5, backoff=10.0, burst=1):
+        """
+        :param float interval: average delay in seconds between 2 writes
+        :param int max_writes: maximum number of writes in flight
+        :param int retries: maximum number of retries of a write rejected by the secondary rate limit
+        :param float backoff: delay in seconds before the first retry, doubled for every next one
+        :param int burst: maximum number of writes going at once, ahead of the average pace
+        :raise ValueError: when burst is lower than 1
+        """
+        if burst < 1:
+            raise ValueError("burst is lower than 1")
+        self.interval = interval
+        self.retries = retries
+        self.backoff = backoff
+        self.burst = burst
+        self.next_write = 0.0
+        self.resume = 0.0
+        self.lock = threading.Lock()
+        self.in_flight = threading.BoundedSemaphore(max_writes)
+
+    def wait(self, delay=0.0):
+        """
+        Reserves the next write slot, at least ``delay`` seconds from now, and sleeps until it comes.
+
+        A delay (i.e a backoff) holds back every write reserved after it, which then resume at the average pace.
+
+        :param float delay: minimum delay in seconds before the write
+        """
+        with self.lock:
+            now = time.monotonic()
+            if delay > 0:
+                # no burst right after a backoff
+                self.resume = max(self.resume, now + delay)
+                self.next_write = max(self.next_write, self.resume + (self.burst - 1) * self.interval)
+            # a write may go up to burst - 1 intervals ahead of the average pace
+            slot = max(now, self.resume, self.next_write - (self.burst - 1) * self.interval)
+            self.next_write = max(slot, self.next_write) + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def call(self, write, *args, **kwargs):
+        """
+        Calls a GitHub write method when throttling allows it.
+
+        :param write: the PyGithub method writing to GitHub, such as ``issue.edit``
+        :param args: positional arguments of ``write``
+        :param kwargs: keyword arguments of ``write``
+        :return: what ``write`` returns
+        :raise github.GithubException: when the write fails for another reason than the secondary rate limit, or after all retries
+        """
+        delay = 0.0
+        attempt = 0
+        while True:
+            self.wait(delay)
+            with self.in_flight:
+                try:
+                    return write(*args, **kwargs)
+                except GithubException as e:
+                    if not is_abuse_limit(e) or attempt >= self.retries:
+                        raise
+            delay = self.backoff * 2 ** attempt
+            attempt = attempt + 1
+            log.warning("Secondary rate limit reached, retrying in {} seconds".format(delay))
+
+
+def is_abuse_limit(exception):
+    """
+    Tells whether a GitHub exception is a rejection from the secondary rate limit (abuse detection).
+
+    :param github.GithubException exception: the exception raised by PyGithub
+    :return: True if the request was rejected because of too many requests submitted too quickly
+    :rtype: bool
+    """
+    if exception.status != 403:
+        return False
+    message = str(exception.data).lower()
+    return "abuse" in message or "secondary rate limit" in message
@@ -7,8 +7,29 @@ from model import (
     GithubTemplate,
     GithubTemplater
 )
+from github_utils import WriteThrottle
 from github import Repository
 import fnmatch
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def issue_unchanged(issue, title, body, labels, state):
+    """
+    Tells whether editing an issue with the given fields would leave it as it is, so that the edit request can be spared.
+
+    :param github.Issue.Issue issue: the issue as fetched from GitHub
+    :param str title: the wanted title
+    :param str body: the wanted body
+    :param labels: the wanted label names
+    :type labels: list(str)
+    :param str state: the wanted state, "open" or "closed"
+    :return: True if the issue already has these title, body, labels and state
+    :rtype: bool
+    """
+    current = (issue.title, issue.body or "", frozenset(lab.name for lab in issue.labels), issue.state)
+    return current == (title, body or "", frozenset(labels), state)
 
 
 class IssuesInstructor:
@@ -17,25 +38,30 @@ class IssuesInstructor:
 
     REQUIRES the repo instance to be authenticated with a user with read/write access to issues.
     """
-    def __init__(self, tracks, repo, label, title_template, body_templater):
+    def __init__(self, tracks, repo, label, title_template, body_templater, throttle, workers=4):
         """
         Empty templates means no update.
 
+        Issues are instructed concurrently by ``workers`` threads, GitHub API calls being mostly waiting on the network.
+
         :param tracks: the translation tracks
         :type tracks: list(tracker.TranslationTrack)
         :param github.Repository.Repository repo: the Github repo with required permission on Issues and Projects
         :param str label: the GitHub label to update only issues holding it, shouldn't be empty
         :param model.GithubTemplate title_template: template defining the issue title for any translation track (``tracker.TranslationTrack``), must include a unique key such as t.translation.path
         :param model.GithubTemplater body_templater: templates mapped to statuses for issue bodies
+        :param github_utils.WriteThrottle throttle: pacing of writes to GitHub, to share with other instructors as GitHub limits writes per user
+        :param int workers: maximum number of issues instructed at the same time
         :raise TypeError: when tracks is not iterable
         :raise TypeError: when any of tracks is not an instance of TranslationTrack
         :raise TypeError: when repo is not an instance of github.Repository.Repository
         :raise TypeError: when title_template is not an instance of model.GithubTemplate
         :raise TypeError: when body_templater is not an instance of model.GithubTemplater
+        :raise TypeError: when throttle is not an instance of github_utils.WriteThrottle
         :raise AttributeError: when title_template is empty
         """
         try:
-            iter(tracks)
+            tracks = list(tracks)
         except TypeError:
             raise TypeError("tracks is not iterable")
         for t in tracks:
@@ -47,6 +73,8 @@ class IssuesInstructor:
             raise TypeError("title_template is not an instance of GithubTemplate")
         if not isinstance(body_templater, GithubTemplater):
             raise TypeError("body_templater is not an instance of GithubTemplater")
+        if not isinstance(throttle, WriteThrottle):
+            raise TypeError("throttle is not an instance of WriteThrottle")
         if title_template.empty:
             raise AttributeError("title_template can't be empty")
 
@@ -55,6 +83,8 @@ class IssuesInstructor:
         self.label = label
         self.title = title_template
         self.body_templater = body_templater
+        self.workers = workers
+        self.throttle = throttle
         # map body templates to their equivalent status, with parameters for issues
         self.issue_policies = {
             Status.TBC: {
@@ -90,7 +120,7 @@ class IssuesInstructor:
             - Up-To-Date translation: closed issue with "translation:ok" label
             - Orphan translation: open issue with "translation:orphan" label
 
-        Inexistent issues will be created, existent will be updated and duplicates (i.e with self.label and same title) will be removed.
+        Inexistent issues will be created if they are to be open, existent will be updated and duplicates (i.e with self.label and same title) will be removed.
 
         :param filters: fnmatch to filter translation file to instruct, such as '*.md' (not case-sensitive)
         :type filters: list(str)
@@ -98,6 +128,10 @@ class IssuesInstructor:
         # List issues from repository having the bot label
         log.debug("Fetch existing issues from Github")
         issues = self.repo.get_issues(state="all", labels=[self.label])
+        # index issues by title once, as every track looks for its own
+        issues_by_title = {}
+        for issue in issues:
+            issues_by_title.setdefault(issue.title, []).append(issue)
 
         subtracks = []
         for t in self.tracks:
@@ -105,48 +139,76 @@ class IssuesInstructor:
                 if fnmatch.fnmatch(t.translation.path.name, pattern):
                     subtracks.append(t)
                     break
-        log.debug("Instructing {} issues out of {} total tracks (filtered by filename)".format(len(subtracks), len(self.tracks)))
+        log.debug("Instructing %s issues out of %s total tracks (filtered by filename)", len(subtracks), len(self.tracks))
 
-        ret = []  # store updated and created open issue numbers
-        total = len(subtracks)
-        cnt = 0
-        for track in subtracks:
-            cnt = cnt + 1
-            policy = self.issue_policies[track.status]
+        # body template, label and state to instruct, looked up once per status
+        dispatch = dict(
+            (status, (self.body_templater[status], policy["label"], policy["state"]))
+            for status, policy in self.issue_policies.items() if status in self.body_templater
+        )
 
-            if track.status in self.body_templater:
-                title = self.title.format(track, self.repo)
-                body = self.body_templater.format(track, self.repo)
-                label = policy["label"]
-                state = policy["state"]
-                log.info("[{}/{}] Instructing issue for {}".format(cnt, total, track.translation.path))
-            else:
-                # issue body template is not defined for current track status, then no update required here
-                log.info("[{}/{}] Skipping {}: template undefined for {} status".format(cnt, total, track.translation.path, track.status))
-                continue
+        total = len(subtracks)
+        # each track owns its issue, so tracks are instructed concurrently
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            numbers = executor.map(
+                lambda args: self.instruct_issue(args[1], issues_by_title, dispatch, args[0], total),
+                enumerate(subtracks, 1)
+            )
+            ret = [n for n in numbers if n is not None]  # store updated and created open issue numbers
 
-            issue_finder = (issue for issue in issues if issue.title == title)
-            issue = next(issue_finder, None)
+        return ret
 
-            if issue is None:
-                log.debug("File {} doesn't have an existing issue, creating it".format(track.translation.path))
-                issue = self.repo.create_issue(title=title, body=body, labels=[self.label, label])
-                log.debug("Successfully created issue #{}".format(issue.number))
-                # closing the created issue afterward if state to 'closed'
-                if state == "closed":
-                    issue.edit(state=state)
+    def instruct_issue(self, track, issues_by_title, dispatch, cnt, total):
+        """
+        Creates or updates the issue of a translation track, closing its duplicates.
+
+        :param tracker.TranslationTrack track: the translation track
+        :param issues_by_title: existing issues indexed by title
+        :type issues_by_title: dict(str, list(github.Issue.Issue))
+        :param dispatch: body template, label and state of issues mapped to the statuses to instruct
+        :type dispatch: dict(tracker.Status, tuple(model.GithubTemplate, str, str))
+        :param int cnt: position of the track, for logging
+        :param int total: number of instructed tracks, for logging
+        :return: the issue number if it is open, None otherwise
+        :rtype: int or None
+        """
+        if track.status in dispatch:
+            body_template, label, state = dispatch[track.status]
+            title = self.title.format(track, self.repo)
+            body = body_template.format(track, self.repo)
+            log.info("[{}/{}] Instructing issue for {}".format(cnt, total, track.translation.path))
+        else:
+            # issue body template is not defined for current track status, then no update required here
+            log.info("[{}/{}] Skipping {}: template undefined for {} status".format(cnt, total, track.translation.path, track.status))
+            return None
+
+        found = issues_by_title.get(title, [])
+
+        if len(found) == 0:
+            if state == "closed":
+                # an issue created only to be closed tracks nothing
+                log.debug("File %s doesn't have an existing issue, none required", track.translation.path)
+                return None
+            log.debug("File %s doesn't have an existing issue, creating it", track.translation.path)
+            issue = self.throttle.call(self.repo.create_issue, title=title, body=body, labels=[self.label, label])
+            log.debug("Successfully created issue #%s", issue.number)
+        else:
+            issue = found[0]
+            # removing duplicate issues if found (with similar title and label)
+            for duplicate in found[1:]:
+                if issue_unchanged(duplicate, duplicate.title, duplicate.body, ["duplicate"], "closed"):
+                    continue
+                log.debug("Found duplicate issue #%s, marking and closing it", duplicate.number)
+                self.throttle.call(duplicate.edit, labels=["duplicate"], state="closed")
+            if issue_unchanged(issue, title, body, [self.label, label], state):
+                log.debug("Found issue #%s for file %s, already up to date", issue.number, track.translation.path)
             else:
-                # removing duplicate issues if found (with similar title and label)
-                for duplicate in issue_finder:
-                    log.debug("Found duplicate issue #{}, marking and closing it".format(duplicate.number))
-                    duplicate.edit(labels=["duplicate"], state="closed")
-                log.debug("Found issue #{} for file {}, updating it".format(issue.number, track.translation.path))
-                issue.edit(title=title, body=body, labels=[self.label, label], state=state)
+                log.debug("Found issue #%s for file %s, updating it", issue.number, track.translation.path)
+                self.throttle.call(issue.edit, title=title, body=body, labels=[self.label, label], state=state)
 
-            if state == "open":
-                ret.append(issue.number)
-
-        return ret
+        if state == "open":
+            return issue.number
+        return None
 
 
 class ProjectsInstructor:
@@ -155,7 +217,7 @@ class ProjectsInstructor:
 
     REQUIRES the repo instance to be authenticated with a user with read/write access to projects.
     """
-    def __init__(self, tracks, repo, title_template, column_templater, card_templater, body_template=GithubTemplate()):
+    def __init__(self, tracks, repo, title_template, column_templater, card_templater, throttle, body_template=GithubTemplate(), workers=4):
         """
         Instanciates the updater with necessary templates and the templaters defining which template to use when encountering different statuses.
 
@@ -170,7 +232,9 @@ class ProjectsInstructor:
         :param model.GithubTemplate title_template: template defining the project title for any translation track (``tracker.TranslationTrack``), can't be empty
         :param model.GithubTemplater column_templater: templates mapped to statuses for column creations
         :param model.GithubTemplater card_templater: templates mapped to statuses for card updates and creations, every templates must format to a unique card (e.g contain translation path as key)
+        :param github_utils.WriteThrottle throttle: pacing of writes to GitHub, to share with other instructors as GitHub limits writes per user
         :param model.GithubTemplate body_template: template defining the body description of a project, when it is created
+        :param int workers: maximum number of projects whose columns are fetched, of columns whose cards are fetched, and of cards updated, at the same time
         :raise TypeError: when tracks is not iterable
         :raise TypeError: when any of tracks is not an instance of TranslationTrack
         :raise TypeError: when repo is not an instance of github.Repository.Repository
@@ -178,10 +242,11 @@ class ProjectsInstructor:
         :raise TypeError: when column_templater is not an instance of model.GithubTemplater
         :raise TypeError: when card_templater is not an instance of model.GithubTemplater
         :raise TypeError: when body_template is not an instance of model.GithubTemplate
+        :raise TypeError: when throttle is not an instance of github_utils.WriteThrottle
         :raise AttributeError: when title_template is empty
         """
         try:
-            iter(tracks)
+            tracks = list(tracks)
         except TypeError:
             raise TypeError("tracks is not iterable")
         for t in tracks:
@@ -197,6 +262,8 @@ class ProjectsInstructor:
             raise TypeError("card_templater is not an instance of GithubTemplater")
         if not isinstance(body_template, GithubTemplate):
             raise TypeError("body_template is not an instance of GithubTemplate")
+        if not isinstance(throttle, WriteThrottle):
+            raise TypeError("throttle is not an instance of WriteThrottle")
         if title_template.empty:
             raise AttributeError("title_template can't be empty")
 
@@ -206,39 +273,80 @@ class ProjectsInstructor:
         self.body = body_template
         self.column_templater = column_templater
         self.card_templater = card_templater
+        self.workers = workers
+        self.throttle = throttle
 
-        # cached projects as {project1_id: {"project": project1, "columns": [column1_id, column2_id]}}
+        # cached projects as {project1_id: {"project": project1, "columns": [column1_id, column2_id], "names": {column1_name: column1_id}}}
         self.projects = None
-        # cached columns as {column1_id: {"column": column1, cards: [card1_id, card2_id]}}
+        # cached project ids as {project1_name: project1_id}
+        self.project_names = {}
+        # cached columns as {column1_id: {"column": column1, "cards": [card1_id, card2_id], "index": {key1: [card1_id]}, "project": project1_id}}
         self.columns = {}
         # cached cards as {card1_id: {"card": card1, "processed": True}}
         self.cards = {}
+        # guards cached columns and cards while cards are updated concurrently, GitHub calls are made outside of it
+        self.lock = threading.Lock()
 
-    def obtain_project(self, title, body):
+        # translation paths, keys of cards, with a regex finding them as whole paths in a note (longest first)
+        self.keys = set(t.translation.path.as_posix() for t in self.tracks)
+        if self.keys:
+            self.key_regex = re.compile(r"(?=(?<![\w.-])({})(?![\w-]|\.[\w-]))".format("|".join(re.escape(k) for k in sorted(self.keys, key=len, reverse=True))))
+        else:
+            self.key_regex = None
+
+    def note_keys(self, note):
+        """
+        Finds every known key (translation path) within a card note, in a single scan of the note.
+
+        A key is found only as a whole path: not directly preceded or followed by other path characters, and not within a longer key found in the note.
+        Hence "docs/a.md" is not found in "docs/a.md.bak" nor in "mydocs/a.md", but is found in "https://github.com/A/R/blob/master/docs/a.md".
+
+        :param str note: the card note, None for cards without note
+        :return: keys found in the note
+        :rtype: set(str)
+        """
+        found = set()
+        if note and self.key_regex is not None:
+            covered = 0
+            for match in self.key_regex.finditer(note):
+                # longest key starting here, ignored when it is part of a longer key found before
+                if match.end(1) > covered:
+                    found.add(match.group(1))
+                    covered = match.end(1)
+        return found
+
+    def obtain_project(self, title, track):
         """
         Gets or creates a project in GitHub repository Projects.
         First time this method is called, it will fetch every projects and cache them.
-        If no project matching the given title is found, a new one will be created and cached with this title and given body.
+        If no project matching the given title is found, a new one will be created and cached with this title and the body template formatted with the given track.
 
         :param str title: the title of the project, as key to find project
-        :param str body: the body description of the project, only used when project is created
+        :param tracker.TranslationTrack track: a track instructed in the project, only used to format the body when the project is created
         :return: the project matching given title
         :rtype: github.Project
         """
         if self.projects is None:
-            # projects not cached, fetch them
-            self.projects = dict((project.id, {"project": project, "columns": None}) for project in self.repo.get_projects())
-
-        project_finder = (pcache["project"] for pcache in self.projects.values() if pcache["project"].name == title)
-        project = next(project_finder, None)
-        if project is None:
+            # projects not cached, fetch them and index them by name (first one kept)
+            self.projects = dict((project.id, {"project": project, "columns": None, "names": None}) for project in self.repo.get_projects())
+            self.project_names = {}
+            for project_id, pcache in self.projects.items():
+                self.project_names.setdefault(pcache["project"].name, project_id)
+
+        project_id = self.project_names.get(title)
+        if project_id is not None:
+            project = self.projects[project_id]["project"]
+        else:
             # project doesn't exist in GitHub Projects, create it
-            log.debug("Creating project '{}'".format(title))
-            project = self.repo.create_project(title, body)
+            log.debug("Creating project '%s'", title)
+            body = self.body.format(track, self.repo)
+            project = self.throttle.call(self.repo.create_project, title, body)
             self.projects[project.id] = {
                 "project": project,
-                "columns": None
+                "columns": None,
+                "names": None
             }
+            self.project_names[title] = project.id
 
         return project
 
@@ -256,34 +364,131 @@ class ProjectsInstructor:
         pcache = self.projects[project.id]
         if pcache["columns"] is None:
             # columns from given project not cached, fetch them
-            pcache["columns"] = []
-            for column in project.get_columns():
-                self.columns[column.id] = {
-                    "column": column,
-                    "cards": None
-                }
-                pcache["columns"].append(column.id)
+            self.cache_columns(project, project.get_columns())
 
-        column_finder = (self.columns[col_id]["column"] for col_id in pcache["columns"] if self.columns[col_id]["column"].name == name)
-        column = next(column_finder, None)
-        if column is None:
+        column_id = pcache["names"].get(name)
+        if column_id is not None:
+            column = self.columns[column_id]["column"]
+        else:
             # column doesn't exist in the project in GitHub, create it
-            log.debug("Creating column '{}'".format(name))
-            column = project.create_column(name)
+            log.debug("Creating column '%s'", name)
+            column = self.throttle.call(project.create_column, name)
             self.columns[column.id] = {
                 "column": column,
-                "cards": None
+                "cards": None,
+                "index": None,
+                "project": project.id
             }
             pcache["columns"].append(column.id)
+            pcache["names"][name] = column.id
 
         return column
 
+    def cache_columns(self, project, columns):
+        """
+        Caches the fetched columns of a project, indexing them by name (first one kept).
+
+        :param github.Project project: the project
+        :param columns: the columns of the project
+        :type columns: iterable(github.ProjectColumn)
+        """
+        pcache = self.projects[project.id]
+        pcache["columns"] = []
+        pcache["names"] = {}
+        for column in columns:
+            self.columns[column.id] = {
+                "column": column,
+                "cards": None,
+                "index": None,
+                "project": project.id
+            }
+            pcache["columns"].append(column.id)
+            pcache["names"].setdefault(column.name, column.id)
+
+    def prefetch_columns(self, projects):
+        """
+        Fetches the columns of every given project not cached yet, concurrently, and caches them.
+
+        :param projects: the projects
+        :type projects: list(github.Project)
+        """
+        projects = [project for project in projects if self.projects[project.id]["columns"] is None]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            fetched = executor.map(lambda project: list(project.get_columns()), projects)
+            for project, columns in zip(projects, fetched):
+                self.cache_columns(project, columns)
+
+    def cache_cards(self, column, cards):
+        """
+        Caches the fetched cards of a column, indexing them by keys found in their notes.
+
+        :param github.ProjectColumn column: the column in the project
+        :param cards: the unarchived cards of the column
+        :type cards: iterable(github.ProjectCard)
+        """
+        ccache = self.columns[column.id]
+        ccache["cards"] = []
+        ccache["index"] = {}
+        for card in cards:
+            self.cards[card.id] = {
+                "card": card,
+                "processed": False
+            }
+            ccache["cards"].append(card.id)
+            for card_key in self.note_keys(card.note):
+                ccache["index"].setdefault(card_key, []).append(card.id)
+
+    def prefetch_cards(self, columns):
+        """
+        Fetches the cards of every given column not cached yet, concurrently, and caches them.
+
+        :param columns: the columns in projects
+        :type columns: list(github.ProjectColumn)
+        """
+        columns = [column for column in columns if self.columns[column.id]["cards"] is None]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            fetched = executor.map(lambda column: list(column.get_cards(archived_state='not_archived')), columns)
+            for column, cards in zip(columns, fetched):
+                self.cache_cards(column, cards)
+
+    def move_card(self, column, key):
+        """
+        Moves to the given column the card found with the key in another column of the same project, when cards of this other column are fetched.
+        The card is claimed by moving it in caches first, so that no other thread moves it as well.
+
+        :param github.ProjectColumn column: the destination column
+        :param str key: key in note, a translation path
+        :return: the moved card, None if no card was found
+        :rtype: github.ProjectCard or None
+        """
+        ccache = self.columns[column.id]
+        with self.lock:
+            for column_id in self.projects[ccache["project"]]["columns"]:
+                other = self.columns[column_id]
+                if column_id == column.id or other["cards"] is None or not other["index"].get(key):
+                    continue
+                card = self.cards[other["index"][key][0]]["card"]
+                other["cards"].remove(card.id)
+                ccache["cards"].append(card.id)
+                for card_key in self.note_keys(card.note):
+                    if card.id in other["index"].get(card_key, []):
+                        other["index"][card_key].remove(card.id)
+                    ccache["index"].setdefault(card_key, []).append(card.id)
+                self.cards[card.id]["processed"] = True
+                break
+            else:
+                return None
+        log.debug("Moving card '%s' from column '%s' to column '%s'", key, other["column"].name, column.name)
+        self.throttle.call(card.move, "top", column)
+        return card
+
     def update_card(self, column, key, note):
         """
         Gets and updates, or creates a card from a project column.
         First time this method is called, it will fetch every cards in the given column and cache them.
         The card is found using the key, which is a substring within the note. This key must be unique.
-        The card is either untouched, updated or created, then left as processed (in ``self.cards``).
+        The card is either untouched, updated, moved from another fetched column of the project, or created, then left as processed (in ``self.cards``).
+        A moved card is only edited if its note changed.
 
         :param github.ProjectColumn column: the column in the project to fetch cards
         :param str key: key in note, a unique substring such as the translation file path
@@ -294,28 +499,37 @@ class ProjectsInstructor:
         ccache = self.columns[column.id]
         if ccache["cards"] is None:
             # cards from given project column not cached, fetch them
-            ccache["cards"] = []
-            for card in column.get_cards(archived_state='not_archived'):
+            cards = list(column.get_cards(archived_state='not_archived'))
+            with self.lock:
+                if ccache["cards"] is None:
+                    self.cache_cards(column, cards)
+
+        with self.lock:
+            if key in self.keys:
+                card_ids = ccache["index"].get(key, [])
+            else:
+                card_ids = [card_id for card_id in ccache["cards"] if key in (self.cards[card_id]["card"].note or "")]
+            card = self.cards[card_ids[0]]["card"] if card_ids else None
+            if card is not None:
+                self.cards[card.id]["processed"] = True
+        if card is None and key in self.keys:
+            # card may be in another fetched column of the project, after its track changed status
+            card = self.move_card(column, key)
+        if card is None:
+            # card doesn't exist in the project columns, create it
+            log.debug("Creating new card '%s' in column '%s'", key, column.name)
+            card = self.throttle.call(column.create_card, note=note)
+            with self.lock:
                 self.cards[card.id] = {
                     "card": card,
-                    "processed": False
+                    "processed": True
                 }
                 ccache["cards"].append(card.id)
-
-        card_finder = (self.cards[card_id]["card"] for card_id in ccache["cards"] if key in self.cards[card_id]["card"].note)
-        card = next(card_finder, None)
-        if card is None:
-            # card doesn't exist in the column, create it
-            log.debug("Creating new card '{}' in column '{}'".format(key, column.name))
-            card = column.create_card(note=note)
-            self.cards[card.id] = {
-                "card": card
-            }
-            ccache["cards"].append(card.id)
+                for card_key in self.note_keys(note):
+                    ccache["index"].setdefault(card_key, []).append(card.id)
         elif card.note != note:
-            log.debug("Editing card '{}' in column '{}'".format(key, column.name))
-            card.edit(note=note)
-        self.cards[card.id]["processed"] = True
+            log.debug("Editing card '%s' in column '%s'", key, column.name)
+            self.throttle.call(card.edit, note=note)
 
         return card
 
@@ -346,30 +560,68 @@ class ProjectsInstructor:
                 if fnmatch.fnmatch(t.translation.path.name, pattern):
                     subtracks.append(t)
                     break
-        log.debug("Instructing {} issues out of {} total tracks (filtered by filename)".format(len(subtracks), len(self.tracks)))
+        log.debug("Instructing %s cards out of %s total tracks (filtered by filename)", len(subtracks), len(self.tracks))
+
+        # column and card templates looked up once per status
+        dispatch = dict(
+            (status, (self.column_templater[status], self.card_templater[status]))
+            for status in Status if status in self.column_templater and status in self.card_templater
+        )
 
         total = len(subtracks)
         cnt = 0
+        instructions = []
         for track in subtracks:
             cnt = cnt + 1
             # format project title and columns templates according to current track
-            if track.status in self.column_templater and track.status in self.card_templater:
-                column_name = self.column_templater.format(track, self.repo)
-                card_note = self.card_templater.format(track, self.repo)
+            if track.status in dispatch:
+                column_template, card_template = dispatch[track.status]
+                column_name = column_template.format(track, self.repo)
+                card_note = card_template.format(track, self.repo)
                 title = self.title.format(track, self.repo)
-                body = self.body.format(track, self.repo)
-                log.info("[{}/{}] Instructing card {} in project {}".format(cnt, total, track.translation.path, title))
             else:
                 # column or card template is not defined for current track status, then no update required here
                 log.info("[{}/{}] Skipping {}: template undefined for {} status".format(cnt, total, track.translation.path, track.status))
                 continue
 
-            project = self.obtain_project(title, body)
-            column = self.obtain_column(project, column_name)
-            self.update_card(column, track.translation.path.as_posix(), card_note)
+            project = self.obtain_project(title, track)
+            instructions.append((cnt, track, title, project, column_name, card_note))
 
-        # archiving unprocessed cached cards
-        for cache_card in self.cards.values():
-            if not cache_card["processed"]:
-                log.debug("Archiving duplicate, obsolete or user-created card")
-                cache_card["card"].edit(archived=True)
+        # fetch columns of every required project at once, before getting them
+        self.prefetch_columns(list(dict((project.id, project) for _, _, _, project, _, _ in instructions).values()))
+        instructions = [
+            (cnt, track, title, self.obtain_column(project, column_name), card_note)
+            for cnt, track, title, project, column_name, card_note in instructions
+        ]
+
+        # fetch cards of every required column at once, before updating them
+        self.prefetch_cards(list(dict((column.id, column) for _, _, _, column, _ in instructions).values()))
+
+        # each track owns its card, so cards are updated concurrently, then unprocessed cached cards are archived
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(lambda instruction: self.instruct_card(*instruction, total), instructions))
+            unprocessed = [cache_card["card"] for cache_card in self.cards.values() if not cache_card["processed"]]
+            list(executor.map(self.archive_card, unprocessed))
+
+    def instruct_card(self, cnt, track, title, column, card_note, total):
+        """
+        Updates or creates the card of a translation track.
+
+        :param int cnt: position of the track, for logging
+        :param tracker.TranslationTrack track: the translation track
+        :param str title: title of the project, for logging
+        :param github.ProjectColumn column: the column where the card belongs
+        :param str card_note: the note of the card
+        :param int total: number of instructed tracks, for logging
+        """
+        log.info("[{}/{}] Instructing card {} in project {}".format(cnt, total, track.translation.path, title))
+        self.update_card(column, track.translation.path.as_posix(), card_note)
+
+    def archive_card(self, card):
+        """
+        Archives a duplicate, obsolete or user-created card.
+
+        :param github.ProjectCard card: the card
+        """
+        log.debug("Archiving duplicate, obsolete or user-created card")
+        self.throttle.call(card.edit, archived=True)
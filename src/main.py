@@ -8,6 +8,7 @@ from git import (
 )
 from github import (
     Github,
+    Repository,
     GithubException,
     BadCredentialsException,
     RateLimitExceededException,
@@ -19,12 +20,20 @@ from tracker import (
     Status
 )
 from model import (
-    TranslationTrackModel,
+    track_model,
+    model_dict,
+    Template,
     StubTemplate,
     GithubTemplate,
     GithubTemplater
 )
 from generator import GitUpdater
+from file_utils import write_json
+from github_utils import (
+    use_shared_session,
+    response_cache,
+    WriteThrottle
+)
 from instructor import (
     IssuesInstructor,
     ProjectsInstructor
@@ -32,10 +41,17 @@ from instructor import (
 
 import traceback
 import argparse
+import os
 import json
+import hashlib
+from collections import Counter
 from pathlib import Path
 
 
+# default author and committer of generated commits
+DEFAULT_ACTOR = Actor('bot', 'bot@example.com')
+
+
 def arg_repo(string):
     """
     Defines a local git repository, whose path is a given parameter.
@@ -100,7 +116,9 @@ class GithubArg(argparse.Action):
         repo_str = values[0]
         token_str = values[1]
         try:
-            g = Github(token_str)
+            # share pooled connections between threads instructing GitHub, and list items by pages of 100 (GitHub maximum)
+            use_shared_session()
+            g = Github(token_str, per_page=100)
             namespace.github_repo = g.get_repo(repo_str)
         except BadCredentialsException:
             msg = "authentication with access token didn't work"
@@ -205,17 +223,121 @@ def make_templater(map):
     return templater
 
 
-if __name__ == '__main__':
+# arguments left out of run fingerprints: where results are written and cached doesn't change them
+FINGERPRINT_IGNORED_ARGS = frozenset(['output', 'tracker_cache', 'run_cache', 'github_cache'])
+
+
+def fingerprint_value(value):
+    """
+    Gives a JSON serializable stand-in for a parsed argument value (see ``run_fingerprint``), the same from one run to another.
+
+    :param value: the parsed argument value, not natively serializable
+    :return: the stand-in value
+    :rtype: str
+    """
+    if isinstance(value, Template):
+        return value.template
+    if isinstance(value, Repo):
+        return value.working_dir
+    if isinstance(value, Repository.Repository):
+        # without the access token, changing between runs
+        return value.full_name
+    if isinstance(value, Actor):
+        return "{} <{}>".format(value.name, value.email)
+    if isinstance(value, Path):
+        return value.as_posix()
+    return str(value)
+
+
+def run_fingerprint(args):
+    """
+    Fingerprints a run from the repository HEAD commit and the parsed arguments, including the templates content.
+
+    The output file, the cache files and the GitHub token are left out, so that they can change between runs, e.g. a temporary output file.
+
+    :param argparse.Namespace args: parsed arguments
+    :return: the fingerprint
+    :rtype: str
+    """
+    values = dict((name, value) for name, value in vars(args).items() if name not in FINGERPRINT_IGNORED_ARGS)
+    data = json.dumps([args.git_repo.head.commit.hexsha, values], sort_keys=True, default=fingerprint_value)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def read_run_cache(path, fingerprint):
+    """
+    Reads the output of the previous run from the run cache file, if it has the same fingerprint.
+
+    An unreadable or invalid cache file is ignored.
+
+    :param pathlib.Path path: the run cache file
+    :param str fingerprint: fingerprint of the current run (see ``run_fingerprint``)
+    :return: the previous output, None if unavailable or if the previous run is different
+    :rtype: str or None
+    """
+    try:
+        with open(path, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        log.debug("No usable run cache in {}: {}".format(path, e))
+        return None
+    if not isinstance(cache, dict) or cache.get('fingerprint') != fingerprint:
+        return None
+    return cache.get('output')
+
+
+def write_run_cache(path, fingerprint, output):
+    """
+    Writes the output of the current run to the run cache file, for next runs.
+
+    :param pathlib.Path path: the run cache file
+    :param str fingerprint: fingerprint of the current run (see ``run_fingerprint``)
+    :param str output: the output of the current run
+    """
+    try:
+        write_json(path, {'fingerprint': fingerprint, 'output': output})
+    except OSError as e:
+        log.warning("Couldn't write run cache to {}.".format(path))
+        log.debug("Got error: {}".format(e))
+
+
+def terminate(code, output=sys.stdout):
+    """
+    Exits right away once output and logs are flushed, skipping the interpreter shutdown (finalizers and garbage collection of git and GitHub objects) which is useless at the end of the job.
+
+    :param int code: the exit status
+    :param output: the output file to flush
+    :type output: io.TextIOBase
+    """
+    output.flush()
+    log.shutdown()
+    os._exit(code)
+
+
+def main(argv):
+    """
+    Runs the job: tracks translation files, generates missing ones and instructs about them on GitHub, as set by command line arguments, then exits.
+
+    :param argv: command line arguments, without the program name
+    :type argv: list(str)
+    """
     logformat = "[%(asctime)s][%(levelname)s] %(message)s"
     log.basicConfig(level=log.INFO, format=logformat)
 
-    LOGGER_LEVELS = ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
+    LOGGER_LEVELS = {
+        "CRITICAL": log.CRITICAL,
+        "ERROR": log.ERROR,
+        "WARNING": log.WARNING,
+        "INFO": log.INFO,
+        "DEBUG": log.DEBUG,
+        "NOTSET": log.NOTSET
+    }
 
     parser = argparse.ArgumentParser(description="Backtrack changes in a git repository original localised files to report on their equivalent translation files")
 
     # General and backtracking args
     parser.add_argument('--log-level', '-l', dest='loglvl', action='store',
-                        type=str, choices=LOGGER_LEVELS, default="INFO", metavar='LOGLVL',
+                        type=str.upper, choices=LOGGER_LEVELS, default="INFO", metavar='LOGLVL',
                         help="set logging level")
     parser.add_argument('--repo', '-r', dest='git_repo', action='store',
                         type=arg_repo, default='.', metavar='PATH',
@@ -227,14 +349,20 @@ if __name__ == '__main__':
                         type=arg_tag_path, nargs='+', metavar='LANGTAG:TRANSLATION_PATH',
                         help="language tags & path patterns matching translation files, relative to 'repo'")
     parser.add_argument('--filter', '-f', dest='filter', action='store',
-                        type=str, default='**', nargs='+', metavar='GLOB',
+                        type=str, default=['**'], nargs='+', metavar='GLOB',
                         help="glob patterns to filter matching files, relative to 'original' and 'translations'")
     parser.add_argument('--ignore', '-i', dest='ignore', action='store',
-                        type=str, default='', nargs='+', metavar='GLOB',
+                        type=str, default=[], nargs='+', metavar='GLOB',
                         help="glob patterns to ignore matching files, relative to 'original' and 'translations'")
     parser.add_argument('--output', '-o', dest='output', action='store',
                         type=argparse.FileType('w'), default=sys.stdout, metavar='FILE',
                         help="output file")
+    parser.add_argument('--tracker-cache', dest='tracker_cache', action='store',
+                        type=Path, metavar='FILE',
+                        help="file caching tracked files history between runs, to only walk new commits")
+    parser.add_argument('--run-cache', dest='run_cache', action='store',
+                        type=Path, metavar='FILE',
+                        help="file caching the output between runs, to skip everything when HEAD, arguments and templates didn't change")
     # Auto generation args
     gen_group = parser.add_argument_group("auto generation", "Auto generate files according to backtracking")
     gen_group.add_argument('--gen-branch', dest='gen_branch', action='store',
@@ -243,10 +371,10 @@ if __name__ == '__main__':
     gen_group.add_argument('--request-merge', dest='request_merge', action='store_true',
                            help="make a Pull Request to merge gen-branch if different than active branch and files were generated")
     gen_group.add_argument('--gen-committer', dest='gen_committer', action=ActorArg("gen_committer"),
-                           type=str, default=Actor('bot', 'bot@example.com'), nargs=2, metavar=('NAME', 'EMAIL'),
+                           type=str, default=DEFAULT_ACTOR, nargs=2, metavar=('NAME', 'EMAIL'),
                            help="committer defined when committing generated files")
     gen_group.add_argument('--gen-author', dest='gen_author', action=ActorArg("gen_author"),
-                           type=str, default=Actor('bot', 'bot@example.com'), nargs=2, metavar=('NAME', 'EMAIL'),
+                           type=str, default=DEFAULT_ACTOR, nargs=2, metavar=('NAME', 'EMAIL'),
                            help="author defined when committing generated files")
     gen_group.add_argument('--gen-stubs', dest='gen_stubs', action='store',
                            type=str, nargs='+', metavar='FNMATCH',
@@ -268,6 +396,15 @@ if __name__ == '__main__':
     instruct_group.add_argument('--github', dest='github_repo', action=GithubArg,
                                 type=str, nargs=2, metavar=('REPO', 'TOKEN'),
                                 help="github repo such as 'Owner/Repo' with access token")
+    instruct_group.add_argument('--github-cache', dest='github_cache', action='store',
+                                type=Path, metavar='FILE',
+                                help="file caching GitHub API responses between runs, to only download changed resources (only reused with the same token)")
+    instruct_group.add_argument('--write-interval', dest='write_interval', action='store',
+                                type=float, default=0.2, metavar='SECONDS',
+                                help="average delay between 2 writes to GitHub, to stay under its secondary rate limits")
+    instruct_group.add_argument('--write-burst', dest='write_burst', action='store',
+                                type=int, default=1, metavar='N',
+                                help="maximum number of writes to GitHub going at once, ahead of the average pace")
     instruct_group.add_argument('--instruct-issues', dest='instruct_issues', action='store',
                                 type=str, nargs='+', metavar='FNMATCH',
                                 help="fnmatch patterns matching translation files to instruct in Issues")
@@ -332,7 +469,10 @@ if __name__ == '__main__':
                                 type=arg_github_template_file, default=GithubTemplate(''), metavar='TEMPLATE FILE',
                                 help="template for instructions about \"Orphan\" translation files, in project column card (must be unique, using {t.translation_path})")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # set chosen log level
+    log.getLogger().setLevel(LOGGER_LEVELS[args.loglvl])
 
     # manual parsing for interdependent arguments
     if args.instruct_issues:
@@ -349,13 +489,34 @@ if __name__ == '__main__':
         elif not args.github_repo.has_projects:
             log.error("Projects is NOT enabled on Github Repository: can't instruct via Projects.")
             exit(1)
+    if args.write_interval < 0:
+        parser.error("write interval must not be negative")
+    if args.write_burst < 1:
+        parser.error("write burst must be at least 1")
+    # check translation paths before walking the repository
+    translation_paths = set()
+    for tag, path in args.translations:
+        if path == args.original:
+            parser.error("translation path {} is the original path".format(path))
+        if path in translation_paths:
+            parser.error("translation path {} is given more than once".format(path))
+        translation_paths.add(path)
 
     try:
-        # set chosen log level
-        log.getLogger().setLevel(args.loglvl)
+        if args.run_cache:
+            fingerprint = run_fingerprint(args)
+            cached_output = read_run_cache(args.run_cache, fingerprint)
+            if cached_output is not None:
+                log.info("Nothing changed since last run, reusing its output.")
+                args.output.write(cached_output)
+                terminate(0, args.output)
+
+        if args.github_cache:
+            response_cache.load(args.github_cache)
 
         # create tracker
-        tracker = TranslationTracker(args.git_repo)
+        tracker = TranslationTracker(args.git_repo, cache_path=args.tracker_cache)
+        tracker.write_commit_graph()
         ignore = args.ignore + ["{}/**/*".format(path.as_posix()) for tag, path in args.translations]
         for tag, path in args.translations:
             tracker.put(path, args.original, tag, original_ignore_globs=ignore, filter_globs=args.filter)
@@ -364,31 +525,36 @@ if __name__ == '__main__':
         log.info("Started tracking given translation files.")
         tracks = tracker.track()
         log.info("Finished tracking given translation files.")
+        counts = Counter(t.status for t in tracks)
+        log.info("Tracked {} translation files: {}.".format(len(tracks), ", ".join("{} {}".format(counts[status], status) for status in Status)))
 
-        # GENERATING inexistent pages
-        if args.gen_branch:
-            branch = args.gen_branch
-        else:
-            branch = args.git_repo.active_branch.name
+        # GENERATING inexistent pages, leaving branches untouched when there is none to generate
+        if (args.gen_stubs or args.gen_copy) and any(t.status == Status.TBC for t in tracks):
+            if args.gen_branch:
+                branch = args.gen_branch
+            else:
+                branch = args.git_repo.active_branch.name
 
-        gitter = GitUpdater(tracks, args.git_repo, args.gen_committer, args.gen_author, branch)
+            gitter = GitUpdater(tracks, args.git_repo, args.gen_committer, args.gen_author, branch)
 
-        if args.gen_stubs:
-            log.info("Started creating stubs for To Create translations.")
-            gitter.create_stubs(args.stub_commit, args.stub_template, args.gen_stubs)
-            log.info("Finished updating stub files.")
+            if args.gen_stubs:
+                log.info("Started creating stubs for To Create translations.")
+                gitter.create_stubs(args.stub_commit, args.stub_template, args.gen_stubs)
+                log.info("Finished updating stub files.")
 
-        if args.gen_copy:
-            log.info("Started copying original files to translation files for To Create translations.")
-            gitter.create_copies(args.copy_commit, args.gen_copy)
-            log.info("Finished copying original files to translation files.")
+            if args.gen_copy:
+                log.info("Started copying original files to translation files for To Create translations.")
+                gitter.create_copies(args.copy_commit, args.gen_copy)
+                log.info("Finished copying original files to translation files.")
 
-        if args.request_merge:
-            gitter.finish(pull_request=args.github_repo, force_push=True)
-        else:
-            gitter.finish(force_push=True)
+            if args.request_merge:
+                gitter.finish(pull_request=args.github_repo, force_push=True)
+            else:
+                gitter.finish(force_push=True)
 
         # INSTRUCTING Issues / Projects
+        # writes of both instructors are paced together, as GitHub limits writes per user
+        throttle = WriteThrottle(interval=args.write_interval, burst=args.write_burst)
         if args.instruct_issues:
             body_templater = make_templater({
                 Status.TBC: args.issue_create_template,
@@ -401,7 +567,8 @@ if __name__ == '__main__':
                                       repo=args.github_repo,
                                       label=args.issue_label,
                                       title_template=args.issue_title_template,
-                                      body_templater=body_templater
+                                      body_templater=body_templater,
+                                      throttle=throttle
                                       )
             log.info("Started instructing in GitHub Issues.")
 
@@ -428,25 +595,38 @@ if __name__ == '__main__':
                                            title_template=args.project_title_template,
                                            column_templater=column_templater,
                                            card_templater=card_templater,
-                                           body_template=args.project_description_template)
+                                           body_template=args.project_description_template,
+                                           throttle=throttle)
             log.info("Started instructing in GitHub Projects.")
 
             projector.instruct(filters=args.instruct_projects)
 
             log.info("Finished instructing in GitHub Projects.")
 
-        out_status = ','.join(["{}:{}".format(t.translation.path, t.status) for t in tracks])
-        json.dump([TranslationTrackModel(t) for t in tracks], args.output, default=lambda o: o.__dict__, separators=(',', ':'))
+        if args.github_cache:
+            response_cache.save(args.github_cache)
+
+        output = json.dumps([track_model(t) for t in tracks], default=model_dict, separators=(',', ':'))
+        args.output.write(output)
+
+        if args.run_cache:
+            write_run_cache(args.run_cache, fingerprint, output)
+
+        terminate(0, args.output)
 
     except RateLimitExceededException as e:
         log.critical("Github rate limit exceeded in the middle of the job, exiting (maybe wait a bit to redo?)")
         log.debug("Github rate limit exceeded: {}".format(str(e)))
-        exit(1)
+        terminate(1, args.output)
     except GithubException as e:
         log.critical("Got an unexpected Github API exception, exiting.")
         log.debug("Unexpected Github exception: {}".format(str(e)))
-        exit(1)
+        terminate(1, args.output)
     except Exception:
         log.critical("Got an unexpected error, exiting.")
         log.debug("Unexpected exception: {}".format(traceback.format_exc()))
-        exit(1)
+        terminate(1, args.output)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -10,8 +10,12 @@ from tracker import (
     OrphanTranslationTrack,
     Status
 )
-from pathlib import Path
-import os.path
+import posixpath
+from functools import lru_cache
+import string
+import operator
+import re
+import weakref
 from github_utils import (
     file_url,
     raw_file_url,
@@ -19,10 +23,24 @@ from github_utils import (
 )
 
 
+def model_dict(model):
+    """
+    Gives the attributes set in a model, such as for JSON serialization (models have slots, no ``__dict__``).
+
+    :param model: a ``GitFileModel``, ``GitPatchModel`` or ``TranslationTrackModel`` instance
+    :return: attribute values mapped to their names, in declaration order
+    :rtype: dict
+    """
+    return dict((name, getattr(model, name)) for name in model.__slots__ if hasattr(model, name))
+
+
 class GitFileModel:
     """
     A model describing a git file.
     """
+    __slots__ = ('path', 'filename', 'directory', 'no_trace', 'commit', 'new_file', 'copied_file', 'renamed_file',
+                 'rename_from', 'rename_to', 'deleted_file', 'lang_tag', 'language')
+
     def __init__(self, git_file):
         """
         Builds the model for templating after the given git file.
@@ -62,6 +80,8 @@ class GitPatchModel:
     """
     A model describing a git patch.
     """
+    __slots__ = ('diff', 'additions', 'deletions', 'changes')
+
     def __init__(self, git_patch):
         """
         Builds the model for templating after the given git patch.
@@ -82,6 +102,9 @@ class TranslationTrackModel:
     """
     A model describing a translation track as an interface for templates to use.
     """
+    # attributes depending on the track status are left unset for others
+    __slots__ = ('translation', 'original', 'status', 'missing_lines', 'base_original', 'patch', 'to_rename', 'deleted', 'surplus_lines')
+
     def __init__(self, track):
         """
         Builds the model for templating after the given track.
@@ -110,12 +133,75 @@ class TranslationTrackModel:
             raise ValueError("track is not an instance of TranslationTrack")
 
 
+# a format field simply naming a value and its attributes, such as "t.translation.path"
+SIMPLE_FIELD_REGEX = re.compile(r"^(\w+)((?:\.\w+)*)$")
+
+CONVERSIONS = {
+    None: lambda value: value,
+    "s": str,
+    "r": repr,
+    "a": ascii
+}
+
+
+def compile_template(template):
+    """
+    Parses a ``format``-type template once into its literal text and fields, so that formatting doesn't parse it again.
+
+    Only fields naming a value and its attributes (e.g "{t.translation.path}"), with an optional conversion and a literal format spec, are compiled.
+
+    :param str template: the template
+    :return: literal text and fields as (value name, attributes getter, conversion, format spec) tuples, or None when the template has other kinds of fields or is malformed
+    :rtype: list(str or tuple) or None
+    """
+    parts = []
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        match = SIMPLE_FIELD_REGEX.match(field)
+        if match is None or "{" in spec or conversion not in CONVERSIONS:
+            return None
+        name, attrs = match.groups()
+        getter = operator.attrgetter(attrs[1:]) if attrs else None
+        parts.append((name, getter, CONVERSIONS[conversion], spec))
+    return parts
+
+
+# models built after tracks, kept as long as their track exists
+track_models = weakref.WeakKeyDictionary()
+
+
+def track_model(track):
+    """
+    Gets the model of a track, built once per track as every template formatted with the track uses the same model.
+
+    :param tracker.TranslationTrack track: the track
+    :return: the model
+    :rtype: TranslationTrackModel
+    :raise ValueError: when track is not an instance of TranslationTrack
+    """
+    if not isinstance(track, TranslationTrack):
+        raise ValueError("track is not an instance of TranslationTrack")
+    model = track_models.get(track)
+    if model is None:
+        model = TranslationTrackModel(track)
+        track_models[track] = model
+    return model
+
+
 class Template:
     """
     Represents a template. Like "{t.translation.language} translation needs to be done here: {translation_url}" for a Github instruction, ``t`` being a TranslationTrackModel instance.
 
     :var str template: the template itself
     :var bool empty: whether the template is an empty string or not, generally meaning to an updater it should not process it
+    :var frozenset names: names of the values used by the template, None when unknown (template not compiled)
     """
     def __init__(self, template=""):
         """
@@ -130,6 +216,11 @@ class Template:
             raise TypeError("template is not str")
         self.template = template
         self.empty = len(self.template) == 0
+        self.parts = compile_template(template)
+        if self.parts is None:
+            self.names = None
+        else:
+            self.names = frozenset(part[0] for part in self.parts if not isinstance(part, str))
 
     def special_args(self, track, **kwargs):
         """
@@ -156,8 +247,35 @@ class Template:
         """
         if not isinstance(t, TranslationTrack):
             raise ValueError("t is not a TranslationTrack instance")
-        data = TranslationTrackModel(t)
-        return self.template.format(t=data, **self.special_args(t, **kwargs))
+        data = track_model(t)
+        values = self.special_args(t, **kwargs)
+        values["t"] = data
+        if self.parts is None:
+            return self.template.format(**values)
+        formatted = []
+        for part in self.parts:
+            if isinstance(part, str):
+                formatted.append(part)
+            else:
+                name, getter, conversion, spec = part
+                value = values[name]
+                if getter is not None:
+                    value = getter(value)
+                formatted.append(format(conversion(value), spec))
+        return "".join(formatted)
+
+
+@lru_cache(maxsize=4096)
+def relative_path(path, start):
+    """
+    Gives the relative path to a file from a directory, both relative to the git repository (so always using "/").
+
+    :param str path: posix path to the file
+    :param str start: posix path to the directory
+    :return: the relative posix path
+    :rtype: str
+    """
+    return posixpath.relpath(path, start)
 
 
 class StubTemplate(Template):
@@ -173,10 +291,20 @@ class StubTemplate(Template):
         :rtype: dict
         """
         return {
-            "translation_to_original_path": Path(os.path.relpath(track.original.path, track.translation.path.parent)).as_posix()
+            "translation_to_original_path": relative_path(track.original.path.as_posix(), track.translation.path.parent.as_posix())
         }
 
 
+# statuses of tracks having an original file, a translation file, and a base original file respectively
+ORIGINAL_STATUSES = frozenset([Status.TBC, Status.TBI, Status.Update, Status.UTD])
+TRANSLATION_STATUSES = frozenset([Status.TBI, Status.Update, Status.UTD, Status.Orphan])
+BASE_ORIGINAL_STATUSES = frozenset([Status.Update])
+# special arguments built from the original file, the translation file and the base original file respectively
+ORIGINAL_ARGS = frozenset(["original_url", "raw_original_url"])
+TRANSLATION_ARGS = frozenset(["translation_url", "raw_translation_url"])
+BASE_ORIGINAL_ARGS = frozenset(["base_original_url", "raw_base_original_url", "compare_url"])
+
+
 class GithubTemplate(Template):
     """
     Represents a template for Github Issues and Projects.
@@ -192,22 +320,31 @@ class GithubTemplate(Template):
             - ``raw_base_original_url``, Github URL to raw base original file (using commit rev). Only with To Update tracks.
             - ``compare_url``, Github URL to Github comparison (using base_original and original commit rev). Only with To Update tracks.
 
+        Arguments the template doesn't use are not built.
+
         :param tracker.TranslationTrack track: the track, base of template
         :param github.Repository.Repository repo: the github repo for URL building purpose
         :return: kwargs for template formatting
         :rtype: dict
         """
         args = {}
-        if isinstance(track, (ToCreateTranslationTrack, ToInitTranslationTrack, ToUpdateTranslationTrack, UpToDateTranslationTrack)):
-            args["original_url"] = file_url(repo.full_name, track.original.commit.hexsha, track.original.path.as_posix())
-            args["raw_original_url"] = raw_file_url(repo.full_name, track.original.commit.hexsha, track.original.path.as_posix())
-        if isinstance(track, (ToInitTranslationTrack, ToUpdateTranslationTrack, UpToDateTranslationTrack, OrphanTranslationTrack)):
-            args["translation_url"] = file_url(repo.full_name, track.branch, track.translation.path.as_posix())
-            args["raw_translation_url"] = raw_file_url(repo.full_name, track.translation.commit.hexsha, track.translation.path.as_posix())
-        if isinstance(track, ToUpdateTranslationTrack):
-            args["base_original_url"] = file_url(repo.full_name, track.base_original.commit.hexsha, track.base_original.path.as_posix()),
-            args["raw_base_original_url"] = raw_file_url(repo.full_name, track.base_original.commit.hexsha, track.base_original.path.as_posix()),
-            args["compare_url"] = compare_url(repo.full_name, track.base_original.commit.hexsha, track.original.commit.hexsha)
+        names = self.names
+        full_name = repo.full_name
+        if track.status in ORIGINAL_STATUSES and (names is None or not names.isdisjoint(ORIGINAL_ARGS)):
+            original_sha = track.original.commit.hexsha
+            original_path = track.original.path.as_posix()
+            args["original_url"] = file_url(full_name, original_sha, original_path)
+            args["raw_original_url"] = raw_file_url(full_name, original_sha, original_path)
+        if track.status in TRANSLATION_STATUSES and (names is None or not names.isdisjoint(TRANSLATION_ARGS)):
+            translation_path = track.translation.path.as_posix()
+            args["translation_url"] = file_url(full_name, track.branch, translation_path)
+            args["raw_translation_url"] = raw_file_url(full_name, track.translation.commit.hexsha, translation_path)
+        if track.status in BASE_ORIGINAL_STATUSES and (names is None or not names.isdisjoint(BASE_ORIGINAL_ARGS)):
+            base_sha = track.base_original.commit.hexsha
+            base_path = track.base_original.path.as_posix()
+            args["base_original_url"] = file_url(full_name, base_sha, base_path)
+            args["raw_base_original_url"] = raw_file_url(full_name, base_sha, base_path)
+            args["compare_url"] = compare_url(full_name, base_sha, track.original.commit.hexsha)
         return args
 
     def format(self, t, repo):
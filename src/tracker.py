@@ -7,6 +7,13 @@ import frontmatter
 from constants import HEADER_TBI_KEY, HEADER_TBI_VALUE
 from pathlib import Path
 import glob
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+from git import Repo, Commit, Blob, NULL_TREE, GitCommandError
+from file_utils import write_json
 
 
 class TrackerException(Exception):
@@ -43,6 +50,22 @@ class Status(str, Enum):
     """Indicates a translation is orphan, it has no corresponding original content."""
     Orphan = "Orphan"
 
+    def __str__(self):
+        """
+        :return: the status value, e.g "To Create", whatever the Python version
+        :rtype: str
+        """
+        return self.value
+
+    def __format__(self, format_spec):
+        """
+        Formats the status value, so that templates show "To Create" rather than "Status.TBC".
+
+        :param str format_spec: the format specification
+        :rtype: str
+        """
+        return format(self.value, format_spec)
+
 
 class GitFile:
     """
@@ -59,7 +82,9 @@ class GitFile:
     :var deleted_file: True if the file was deleted, False otherwise
     :var git.Blob blob: file blob representation, None if ``no_trace`` or ``deleted_file``
     """
-    def __init__(self, path, commit):
+    __slots__ = ('path', 'no_trace', 'commit', 'new_file', 'copied_file', 'renamed_file', 'rename_from', 'rename_to', 'deleted_file', 'blob')
+
+    def __init__(self, path, commit, trace=True, history=None):
         """
         Get file info for a file at given path and from given rev commit.
 
@@ -67,6 +92,8 @@ class GitFile:
 
         :param pathlib.Path path: the file path relative to git repo
         :param git.Commit commit: last commit to start tracing last changer commit and get diff from
+        :param bool trace: whether to trace the file in history, else it's set with no trace without walking commits, defaults to True
+        :param dict history: last changer commit SHAs from ``commit`` (None for no trace) by posix path, already found for several files at once (see ``TranslationTracker.last_changes``), defaults to walking commits for this file
         """
         # init default values
         self.path = path
@@ -79,31 +106,34 @@ class GitFile:
         self.rename_to = None
         self.deleted_file = False
         self.blob = None
+        if not trace:
+            return
         # get last commit changing given path
-        it = commit.repo.iter_commits(rev=commit, paths=path, max_count=1)
+        if history is not None and path.as_posix() in history:
+            sha = history[path.as_posix()]
+            it = iter([commit.repo.commit(sha)] if sha else [])
+        else:
+            it = commit.repo.iter_commits(rev=commit, paths=path, max_count=1)
         try:
             self.commit = next(it)
-            # get what last changed on file
-            try:
-                # get diff between parent and changer commit
-                p = next(self.commit.iter_parents())
-                diff = p.diff(self.commit, paths=path)[0]
-
-                self.new_file = diff.new_file
-                self.copied_file = diff.copied_file
-                self.renamed_file = diff.renamed_file
-                self.deleted_file = diff.deleted_file
-                self.blob = diff.b_blob
-                if self.renamed_file:
-                    self.rename_from = Path(diff.rename_from)
-                    self.rename_to = Path(diff.rename_to)
-                    if self.rename_to != path.name:
-                        # redefine path to new name
-                        self.path = Path(diff.b_path)
-                self.no_trace = False
-            except StopIteration:
-                # no parent (changer commit is root)
-                self.new_file = True
+            # get what last changed on file: diff between parent and changer commit, or from an empty tree when changer commit is root
+            # (parents are read from the commit object, without spawning a rev-list)
+            if self.commit.parents:
+                diff = self.commit.parents[0].diff(self.commit, paths=path)[0]
+            else:
+                diff = self.commit.diff(NULL_TREE, paths=path)[0]
+            self.new_file = diff.new_file
+            self.copied_file = diff.copied_file
+            self.renamed_file = diff.renamed_file
+            self.deleted_file = diff.deleted_file
+            self.blob = diff.b_blob
+            if self.renamed_file:
+                self.rename_from = Path(diff.rename_from)
+                self.rename_to = Path(diff.rename_to)
+                if self.rename_to != path.name:
+                    # redefine path to new name
+                    self.path = Path(diff.b_path)
+            self.no_trace = False
             # for some reasons, diff may not initialize b_blob (when renamed especially), let's find it here if that's the case
             if not self.deleted_file and self.blob is None:
                 self.blob = self.commit.tree[self.path.as_posix()]
@@ -111,10 +141,22 @@ class GitFile:
             # the path was not found in git
             self.no_trace = True
 
-    def cnt_lines(self):
+    def bind(self, repo):
+        """
+        Binds ``commit`` and ``blob`` to another ``git.Repo`` instance of the same repository, so that they don't depend on the instance they were read from (e.g. once it's closed).
+
+        :param git.Repo repo: the repository instance
+        """
+        if self.commit is not None:
+            self.commit = Commit(repo, self.commit.binsha)
+        if self.blob is not None:
+            self.blob = Blob(repo, self.blob.binsha, self.blob.mode, self.blob.path)
+
+    def cnt_lines(self, cache=None):
         """
         Count lines ('\n' separated) in ``self.blob``.
 
+        :param dict cache: line counts by blob SHA, shared with other files (the same original blob is counted for each of its translations), defaults to no cache
         :return: number of lines in blob
         :rtype: int
         :raise NotImplementedError: when the blob is not set, either no_trace or deleted_file
@@ -122,11 +164,45 @@ class GitFile:
         """
         if self.no_trace or self.deleted_file:
             raise NotImplementedError("blob is not set, can't count lines")
-        try:
-            data = self.blob.data_stream.read()
-        except (AttributeError, IOError):
-            raise ValueError("invalid blob to count lines from")
-        return data.count(b"\n") + 1
+        if cache is None:
+            return count_lines(self.blob)
+        sha = self.blob.hexsha
+        lines = cache.get(sha)
+        if lines is None:
+            lines = cache[sha] = count_lines(self.blob)
+        return lines
+
+
+# null object SHA, as shown by git for a missing file
+NULL_SHA = "0" * 40
+# maximum number of paths given to a single git log or git diff
+LOG_PATHS_CHUNK = 1000
+
+# bytes read at once when counting lines
+LINES_CHUNK_SIZE = 64 * 1024
+
+
+def count_lines(blob):
+    """
+    Count lines ('\n' separated) in a blob.
+
+    Content is streamed in chunks, so that big files never get fully loaded in memory, and empty blobs are not read at all.
+
+    :param git.Blob blob: blob to read
+    :return: number of lines in blob
+    :rtype: int
+    :raise ValueError: when blob is invalid
+    """
+    try:
+        if blob.size == 0:
+            return 1
+        stream = blob.data_stream
+        lines = 1
+        for chunk in iter(lambda: stream.read(LINES_CHUNK_SIZE), b""):
+            lines += chunk.count(b"\n")
+    except (AttributeError, IOError):
+        raise ValueError("invalid blob to count lines from")
+    return lines
 
 
 class TranslationGitFile(GitFile):
@@ -136,26 +212,45 @@ class TranslationGitFile(GitFile):
     :var str lang_tag: language tag / code like 'fr' or 'fr-FR', from RFC5646
     :var str language: equivalent language from lang_tag
     """
-    def __init__(self, path, lang_tag, commit):
-        super().__init__(path, commit)
+    __slots__ = ('lang_tag',)
+
+    def __init__(self, path, lang_tag, commit, trace=True, history=None):
+        """
+        Get file info for a translation file (see ``GitFile``), with its language.
+
+        :raise LanguageTagException: when ``lang_tag`` is not valid according to RFC5646
+        """
+        if lang_tag not in RFC5646_LANGUAGE_TAGS:
+            raise LanguageTagException()
+        super().__init__(path, commit, trace, history)
         self.lang_tag = lang_tag
 
-    def __setattr__(self, name, value):
+    @property
+    def language(self):
         """
-        Modified special method to include constraints for language:
-            - can't change ``language`` directly
-            - ``lang_tag`` must be valid according to RFC5646, and will change ``language`` accordingly
+        Language from ``lang_tag``, can't be changed directly.
+
+        :rtype: str
         """
-        if name == 'lang_tag':
-            try:
-                super().__setattr__('language', RFC5646_LANGUAGE_TAGS[value])
-            except KeyError:
-                raise LanguageTagException()
-            super().__setattr__('lang_tag', value)
-        elif name == 'language':
-            raise NotImplementedError("can't change language, use lang_tag")
-        else:
-            super().__setattr__(name, value)
+        return RFC5646_LANGUAGE_TAGS[self.lang_tag]
+
+
+def cached_git_file(cache, path, commit, history=None):
+    """
+    Gets the git file for a path from a rev commit out of a cache, creating (and caching) it when missing.
+
+    :param dict cache: the cache, key: (posix path, commit SHA), value: GitFile
+    :param pathlib.Path path: the file path relative to git repo
+    :param git.Commit commit: last commit to start tracing last changer commit from
+    :param dict history: last changer commits already found from ``commit`` (see ``GitFile``)
+    :return: the git file
+    :rtype: GitFile
+    """
+    key = (path.as_posix(), commit.hexsha)
+    git_file = cache.get(key)
+    if git_file is None:
+        git_file = cache[key] = GitFile(path, commit, history=history)
+    return git_file
 
 
 class GitPatch:
@@ -167,30 +262,53 @@ class GitPatch:
     :var int deletions: number of deleted lines
     :var int changes: total number of changes (additions + deletions)
     """
-    def __init__(self, a_file, b_file):
+    __slots__ = ('diff', 'additions', 'deletions', 'changes')
+
+    def __init__(self, a_file, b_file, diff=None):
         """
         Calculates a git diff from ``a_file`` to ``b_file``. Results to all instance variables set.
 
+        The patch is generated with a single git process, line counts are read from it: the JSON output always carries the literal diff.
+
         :param GitFile a_file: the base file to start the diff
         :param GitFile b_file: the second file to end diff
+        :param git.Diff diff: the diff from ``a_file`` to ``b_file`` with its patch, already generated along others (see ``TranslationTracker.set_patches``), defaults to generating it
         :raise ValueError: when no diff b_file.path doesn't exist between a_file.commit and b_file.commit
         """
         # get diff to get applied patch
-        a_commit = a_file.commit
         b_commit = b_file.commit
-        diffs = a_commit.diff(b_commit, paths=b_file.path, create_patch=True)
-        try:
-            diff = diffs[0]
-        except IndexError:
-            log.debug("Got base commit {} and new commit {}".format(a_commit, b_commit))
-            raise ValueError("invalid files to diff, path between both revs")
+        if diff is None:
+            a_commit = a_file.commit
+            diffs = a_commit.diff(b_commit, paths=b_file.path, create_patch=True)
+            try:
+                diff = diffs[0]
+            except IndexError:
+                log.debug("Got base commit {} and new commit {}".format(a_commit, b_commit))
+                raise ValueError("invalid files to diff, path between both revs")
         self.diff = diff.diff.decode(b_commit.encoding)
-        # get additions, deletions and changes
+        # get additions, deletions and changes, file headers are not part of the patch bytes (binary files count no lines)
         self.additions = diff.diff.count(b"\n+")
         self.deletions = diff.diff.count(b"\n-")
         self.changes = self.additions + self.deletions
 
 
+def cached_git_patch(cache, a_file, b_file):
+    """
+    Gets the patch between two git files out of a cache, creating (and caching) it when missing.
+
+    :param dict cache: the cache, key: (a commit SHA, b commit SHA, b posix path), value: GitPatch
+    :param GitFile a_file: the base file to start the diff
+    :param GitFile b_file: the second file to end diff
+    :return: the patch
+    :rtype: GitPatch
+    """
+    key = (a_file.commit.hexsha, b_file.commit.hexsha, b_file.path.as_posix())
+    patch = cache.get(key)
+    if patch is None:
+        patch = cache[key] = GitPatch(a_file, b_file)
+    return patch
+
+
 class TranslationTrack:
     """
     A translation track, associating an original file and a translation file.
@@ -200,19 +318,17 @@ class TranslationTrack:
     :var Status status: the status for the translation file
     :var str branch: name of the git branch where tracking was done
     """
+    # weak references allow caching data built from a track for its lifetime
+    __slots__ = ('translation', 'original', 'status', 'branch', '__weakref__')
+
     def __init__(self, translation, original, status, branch):
-        if isinstance(translation, TranslationGitFile):
-            self.translation = translation
-        else:
-            raise ValueError("translation must be an instance of TranslationGitFile")
-        if isinstance(original, GitFile):
-            self.original = original
-        else:
-            raise ValueError("original must be an instance of GitFile")
-        if isinstance(status, Status):
-            self.status = status
-        else:
-            raise ValueError("status must be an instance of Status")
+        # type checks are for development only, stripped when running optimized (python -O)
+        assert isinstance(translation, TranslationGitFile), "translation must be an instance of TranslationGitFile"
+        assert isinstance(original, GitFile), "original must be an instance of GitFile"
+        assert isinstance(status, Status), "status must be an instance of Status"
+        self.translation = translation
+        self.original = original
+        self.status = status
         self.branch = branch
 
 
@@ -222,9 +338,14 @@ class ToCreateTranslationTrack(TranslationTrack):
 
     :var int missing_lines: number of lines to translate from original files
     """
-    def __init__(self, translation, original, branch):
+    __slots__ = ('missing_lines',)
+
+    def __init__(self, translation, original, branch, lines=None):
+        """
+        :param dict lines: cache of line counts by blob SHA (see ``GitFile.cnt_lines``), defaults to no cache
+        """
         super().__init__(translation, original, Status.TBC, branch)
-        self.missing_lines = self.original.cnt_lines()
+        self.missing_lines = self.original.cnt_lines(lines)
 
 
 class ToInitTranslationTrack(TranslationTrack):
@@ -233,9 +354,14 @@ class ToInitTranslationTrack(TranslationTrack):
 
     :var int missing_lines: number of lines to translate from original files
     """
-    def __init__(self, translation, original, branch):
+    __slots__ = ('missing_lines',)
+
+    def __init__(self, translation, original, branch, lines=None):
+        """
+        :param dict lines: cache of line counts by blob SHA (see ``GitFile.cnt_lines``), defaults to no cache
+        """
         super().__init__(translation, original, Status.TBI, branch)
-        self.missing_lines = self.original.cnt_lines()
+        self.missing_lines = self.original.cnt_lines(lines)
 
 
 class ToUpdateTranslationTrack(TranslationTrack):
@@ -246,7 +372,16 @@ class ToUpdateTranslationTrack(TranslationTrack):
     :var GitPatch patch: patch / diff between the original file and base original file
     :var bool to_rename: True if translation file has not the same name as original file, False otherwise
     """
-    def __init__(self, translation, original, branch):
+    __slots__ = ('base_original', 'patch', 'to_rename')
+
+    def __init__(self, translation, original, branch, git_files=None, patches=None, diff=True):
+        """
+        Sets up the track, getting the base original file and the patch from it to the original file.
+
+        :param dict git_files: cache of git files to get the base original file from (see ``cached_git_file``), defaults to no cache
+        :param dict patches: cache of patches, shared by translations based on the same original file (see ``cached_git_patch``), defaults to no cache
+        :param bool diff: whether to get the patch right away, else ``patch`` is left None, to be set along other tracks (see ``TranslationTracker.set_patches``), defaults to True
+        """
         super().__init__(translation, original, Status.Update, branch)
         if translation.path.name != original.path.name:
             self.to_rename = True
@@ -258,15 +393,25 @@ class ToUpdateTranslationTrack(TranslationTrack):
             bo_path = original.rename_from
         else:
             bo_path = original.path
-        self.base_original = GitFile(bo_path, translation.commit)
+        if git_files is None:
+            self.base_original = GitFile(bo_path, translation.commit)
+        else:
+            self.base_original = cached_git_file(git_files, bo_path, translation.commit)
 
-        self.patch = GitPatch(self.base_original, original)
+        if not diff:
+            self.patch = None
+        elif patches is None:
+            self.patch = GitPatch(self.base_original, original)
+        else:
+            self.patch = cached_git_patch(patches, self.base_original, original)
 
 
 class UpToDateTranslationTrack(TranslationTrack):
     """
     **Up-To-Date** translation track. Status is set to ``Status.UTD``.
     """
+    __slots__ = ()
+
     def __init__(self, translation, original, branch):
         super().__init__(translation, original, Status.UTD, branch)
 
@@ -278,56 +423,279 @@ class OrphanTranslationTrack(TranslationTrack):
     :var bool deleted: True if the original file was deleted, False otherwise (i.e original never existed)
     :var int surplus_lines: number of lines in orphan translation
     """
-    def __init__(self, translation, original, branch):
+    __slots__ = ('deleted', 'surplus_lines')
+
+    def __init__(self, translation, original, branch, lines=None):
+        """
+        :param dict lines: cache of line counts by blob SHA (see ``GitFile.cnt_lines``), defaults to no cache
+        """
         super().__init__(translation, original, Status.Orphan, branch)
 
         self.deleted = self.original.deleted_file
-        self.surplus_lines = self.translation.cnt_lines()
+        self.surplus_lines = self.translation.cnt_lines(lines)
+
+
+def glob_regex(pattern):
+    """
+    Translates a glob pattern into a compiled regular expression matching whole paths, the way ``glob.glob(pattern, recursive=True)`` would match them:
+        - ``**`` as a whole path segment matches zero or more directories
+        - ``*``, ``?`` and ``[...]`` never match the ``/`` separator
+        - wildcards don't match hidden names (starting with '.'), unless the pattern segment starts with '.' too
+
+    :param str pattern: glob pattern, using '/' as separator
+    :return: the regular expression, to use with ``match``
+    :rtype: re.Pattern
+    """
+    res = ""
+    segments = pattern.split("/")
+    last = len(segments) - 1
+    for i, seg in enumerate(segments):
+        if seg == "**":
+            # recursive wildcard, excluding hidden directories and files
+            res += "(?:[^/.][^/]*/)*"
+            if i == last:
+                res += "[^/.][^/]*"
+            continue
+        if glob.has_magic(seg) and not seg.startswith("."):
+            res += "(?!\\.)"
+        res += translate_segment(seg)
+        if i != last:
+            res += "/"
+    return re.compile(res + "\\Z")
+
+
+def translate_segment(segment):
+    """
+    Translates a glob pattern segment (with no '/') into a regular expression, like ``fnmatch.translate`` without matching '/'.
+
+    :param str segment: glob pattern segment
+    :return: regular expression
+    :rtype: str
+    """
+    res = ""
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i = i + 1
+        if c == "*":
+            res += "[^/]*"
+        elif c == "?":
+            res += "[^/]"
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j = j + 1
+            if j < n and segment[j] == "]":
+                j = j + 1
+            while j < n and segment[j] != "]":
+                j = j + 1
+            if j >= n:
+                res += "\\["
+            else:
+                stuff = segment[i:j].replace("\\", "\\\\")
+                # '[' and set operations ('&&', '~~', '||') are literal in a glob set, not in a regular expression set
+                stuff = re.sub(r"([\[&~|])", r"\\\1", stuff)
+                i = j + 1
+                if stuff[0] == "!":
+                    stuff = "^" + stuff[1:]
+                elif stuff[0] == "^":
+                    stuff = "\\" + stuff
+                # sets never match the separator (the set is left as is, a leading ']' or '-' stays literal)
+                res += "(?!/)[{}]".format(stuff)
+        else:
+            res += re.escape(c)
+    return res
+
+
+def glob_hidden(pattern, top):
+    """
+    Tells whether a glob pattern can match hidden files or files within hidden directories below a walked directory, i.e. whether a segment after this directory (or after the pattern literal base) starts with '.'.
+
+    :param str pattern: glob pattern, using '/' as separator
+    :param str top: the walked directory path, using '/' as separator
+    :return: True if the pattern can match hidden paths, False otherwise
+    :rtype: bool
+    """
+    prefix = top.rstrip("/") + "/"
+    if pattern.startswith(prefix):
+        segments = pattern[len(prefix):].split("/")
+    else:
+        segments = pattern.split("/")
+        for i, seg in enumerate(segments):
+            if glob.has_magic(seg):
+                segments = segments[i:]
+                break
+        else:
+            segments = []
+    return any(s.startswith(".") and s not in (".", "..") for s in segments)
 
 
-def fetch_files(path, filter_globs, ignore_globs=[]):
+def walk_files(top, hidden=False, pruned=()):
+    """
+    Walks a directory tree with ``os.scandir``, yielding every file entry within it (at any depth).
+
+    Unreadable or inexistent directories are silently skipped.
+
+    :param str top: the directory path to walk
+    :param bool hidden: whether hidden directories (starting with '.') are walked into
+    :param pruned: paths of directories not to walk into, each ending with '/'
+    :type pruned: tuple(str)
+    :return: file entries, which ``path`` attribute is joined to ``top``
+    :rtype: iterator(os.DirEntry)
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir():
+            if (hidden or not entry.name.startswith(".")) and not (entry.path + "/").startswith(pruned):
+                yield from walk_files(entry.path, hidden, pruned)
+        elif entry.is_file():
+            yield entry
+
+
+class GlobPatterns:
+    """
+    Glob patterns compiled once into regular expressions, to be matched against walked paths.
+
+    :var globs: the glob patterns, using '/' as separator
+    :vartype globs: list(str)
+    :var regexes: compiled regular expressions, one for each glob pattern
+    :vartype regexes: list(re.Pattern)
+    :var re.Pattern regex: union of all regular expressions, None without patterns
+    """
+    def __init__(self, globs):
+        """
+        Compiles glob patterns.
+
+        :param globs: glob patterns, using '/' as separator
+        :type globs: list(str)
+        """
+        self.globs = list(globs)
+        self.regexes = [glob_regex(g) for g in self.globs]
+        # a single alternation matches a path in one call whatever the number of patterns
+        if self.regexes:
+            self.regex = re.compile("|".join("(?:{})".format(r.pattern) for r in self.regexes))
+        else:
+            self.regex = None
+
+    def match(self, path):
+        """
+        Tells whether a path matches any of the patterns.
+
+        :param str path: the path, using '/' as separator
+        :return: True if one pattern matches, False otherwise
+        :rtype: bool
+        """
+        return self.regex is not None and self.regex.match(path) is not None
+
+    def directories(self):
+        """
+        Gives the directories whose every (not hidden) file matches a pattern, from patterns like "dir/**/*" or "dir/**" with no wildcard in "dir".
+
+        :return: the directory paths, each ending with '/'
+        :rtype: tuple(str)
+        """
+        directories = []
+        for g in self.globs:
+            for suffix in ("/**/*", "/**"):
+                if g.endswith(suffix):
+                    base = g[:-len(suffix)]
+                    if base and not glob.has_magic(base) and "/." not in "/" + base:
+                        directories.append(base + "/")
+                    break
+        return tuple(directories)
+
+    def hidden(self, top):
+        """
+        Tells whether any of the patterns can match hidden paths below a walked directory (see ``glob_hidden``).
+
+        :param str top: the walked directory path, using '/' as separator
+        :rtype: bool
+        """
+        return any(glob_hidden(g, top) for g in self.globs)
+
+
+def fetch_files(path, filters, ignores=None):
     """
     Fetch files matching filtering glob patterns, excluding those matching ignoring glob patterns, within a directory.
 
+    The directory is walked only once, each file being matched against the compiled patterns.
+
     :param pathlib.Path path: a valid directory path
-    :param filter_globs: glob-like patterns for files to filter
-    :type filter_globs: list(str)
-    :param ignore_globs: glob-like patterns for files to ignore
-    :type ignore_globs: list(str)
+    :param GlobPatterns filters: glob-like patterns for files to filter
+    :param GlobPatterns ignores: glob-like patterns for files to ignore, defaults to none
     :return: resulting paths
     :rtype: list(pathlib.Path)
     """
     files = []
-    excludes = []
-    log.debug("Seeking files in {} filtered with {} and ignoring {}".format(path, filter_globs, ignore_globs))
-    for gi in ignore_globs:
-        ex = glob.iglob(gi, recursive=True)
-        excludes.extend([Path(n) for n in ex])
-    for gf in filter_globs:
-        fi = glob.iglob(gf, recursive=True)
-        for n in fi:
-            p = Path(n)
-            if path in p.parents and p.is_file() and p not in excludes:
-                files.append(p)
+    log.debug("Seeking files in {} filtered with {} and ignoring {}".format(path, filters.globs, ignores.globs if ignores else []))
+    top = path.as_posix()
+    hidden = filters.hidden(top)
+    # entirely ignored directories aren't walked, unless hidden files (never ignored by wildcards) may be kept
+    pruned = ignores.directories() if ignores and not hidden else ()
+    for entry in walk_files(top, hidden, pruned):
+        if filters.match(entry.path) and not (ignores and ignores.match(entry.path)):
+            files.append(Path(entry.path))
     return files
 
 
+def fetch_nested_files(path, nested_path, filters, ignores=None):
+    """
+    Fetch files matching filtering glob patterns within a directory and within one of its sub-directories, walking the directory only once.
+
+    This is equivalent to ``fetch_files(path, filters, ignores)`` and ``fetch_files(nested_path, filters)``: ignoring patterns don't apply to the sub-directory files.
+
+    :param pathlib.Path path: a valid directory path
+    :param pathlib.Path nested_path: a directory path within ``path``, not hidden from it
+    :param GlobPatterns filters: glob-like patterns for files to filter
+    :param GlobPatterns ignores: glob-like patterns for files to ignore from the directory, defaults to none
+    :return: resulting paths within the directory, and resulting paths within the sub-directory
+    :rtype: tuple(list(pathlib.Path), list(pathlib.Path))
+    """
+    files = []
+    nested_files = []
+    log.debug("Seeking files in {} and {} filtered with {} and ignoring {}".format(path, nested_path, filters.globs, ignores.globs if ignores else []))
+    top = path.as_posix()
+    nested_prefix = nested_path.as_posix() + "/"
+    hidden = filters.hidden(top) or filters.hidden(nested_path.as_posix())
+    # entirely ignored directories aren't walked, except the sub-directory and its parents
+    pruned = ()
+    if ignores and not hidden:
+        pruned = tuple(d for d in ignores.directories() if not nested_prefix.startswith(d) and not d.startswith(nested_prefix))
+    for entry in walk_files(top, hidden, pruned):
+        if not filters.match(entry.path):
+            continue
+        p = Path(entry.path)
+        if entry.path.startswith(nested_prefix):
+            nested_files.append(p)
+        if not (ignores and ignores.match(entry.path)):
+            files.append(p)
+    return files, nested_files
+
+
 def replace_parent(path, parent, new_parent):
     """
     Forge a new path a parent path into a new parent path.
 
     Useful to get corresponding path from translation file to original file, or from original file to translation file.
 
-    :param pathlib.Path path: the path to translate
-    :param pathlib.Path parent: one of the path parents, to remove
-    :param str new_parent: new path to inject in place of parent
-    :return: forged path
-    :rtype: pathlib.Path
+    Works on posix strings rather than ``pathlib.Path`` objects, as it runs for every mapped file.
+
+    :param str path: the posix path to translate
+    :param str parent: one of the path parents as posix path, to remove
+    :param str new_parent: new posix path to inject in place of parent
+    :return: forged posix path
+    :rtype: str
     """
-    parent_str = parent.as_posix()
-    child_str = path.as_posix()
-    child_suffix = child_str[len(parent_str):]  # includes first char '/' if path != parent
-    return Path("{}{}".format(new_parent.as_posix(), child_suffix))
+    # current directory is every relative path parent, without being its prefix
+    if parent == ".":
+        return "{}/{}".format(new_parent, path)
+    elif new_parent == ".":
+        return path[len(parent) + 1:]
+    return new_parent + path[len(parent):]  # suffix includes first char '/' if path != parent
 
 
 def get_blob(self, path, commit):
@@ -345,11 +713,21 @@ def get_blob(self, path, commit):
         return None
 
 
+# frontmatter parser reads files as UTF-8
+TBI_KEY_BYTES = HEADER_TBI_KEY.encode("utf-8")
+# boundary lines of YAML and TOML headers, as matched by the frontmatter parser, by header start
+HEADER_BOUNDARY_REGEXES = {
+    b"---": re.compile(rb"^-{3,}\s*$", re.MULTILINE),
+    b"+++": re.compile(rb"^\+{3,}\s*$", re.MULTILINE)
+}
+
+
 def has_tbi_header(blob):
     """
     Determines whether the To Initialize header is within a given blob representation of a file.
 
-    Currently it uses a frontmatter parser (work with yaml and markdown).
+    Currently it uses a frontmatter parser (work with yaml and markdown), only when the file starts with a header where the key literally appears: most files can't have the header and skip the parsing.
+    Only a YAML or TOML header is parsed, not the rest of the file (TOML headers need the ``toml`` package, as for the frontmatter parser).
     The header, as key:value is defined in constants HEADER_TBI_KEY and HEADER_TBI_VALUE.
 
     :param git.Blob blob: blob to read
@@ -358,9 +736,26 @@ def has_tbi_header(blob):
     :raise ValueError: when the blob is invalid
     """
     try:
-        post = frontmatter.loads(blob.data_stream.read())
+        data = blob.data_stream.read()
     except (AttributeError, IOError):
         raise ValueError("invalid blob to read header from")
+    # the parser ignores leading whitespaces
+    data = data.lstrip()
+    boundary = HEADER_BOUNDARY_REGEXES.get(data[:3])
+    if boundary is not None:
+        # the header ends at the next boundary line
+        start = boundary.match(data)
+        end = boundary.search(data, start.end()) if start is not None else None
+        if end is None:
+            return False
+        data = data[:end.end()]
+    elif not data.startswith(b"{"):
+        # no header the parser could detect
+        return False
+    if TBI_KEY_BYTES not in data:
+        return False
+    try:
+        post = frontmatter.loads(data)
     except UnicodeDecodeError:
         # not frontmatter type file
         return False
@@ -371,14 +766,22 @@ class TranslationTracker:
     """
     Represents the tracking part of the script, checking existent/non existent translation files and diff when changes where applied to original file.
     """
-    def __init__(self, git_repo):
+    def __init__(self, git_repo, workers=None, cache_path=None):
         """
         Creates the tracker for the specified language (use the tag from RFC 5646) and link the preliminary setup git repo.
 
         :param git.Repo git_repo: the git repository
+        :param int workers: maximum number of threads tracking files concurrently, defaults to ``ThreadPoolExecutor`` default
+        :param pathlib.Path cache_path: file caching last changer commits (see ``last_changes``) and To Initialize headers (see ``tbi_header``) between runs, defaults to no cache
         """
-        self.map = {}  # key: (translation Path, language tag), value: original Path
+        self.map = {}  # key: (translation posix path, language tag), value: original posix path
         self.repo = git_repo
+        self.workers = workers
+        self.cache_path = cache_path
+        self.ancestry = {}  # key: (ancestor SHA, descendant SHA), value: whether ancestor is one of descendant ancestors
+        self.cached_headers = {}  # key: blob SHA, value: whether the blob has the To Initialize header, as of the previous run
+        self.headers = {}  # same as cached_headers, for blobs checked by this run
+        self.lines = {}  # key: blob SHA, value: number of lines in the blob, for blobs counted by this run
         self.working_dir = Path(self.repo.git.working_dir)
 
     def abs_path(self, path):
@@ -462,27 +865,194 @@ class TranslationTracker:
             abs_translations = [abs_translation_path]
         elif abs_original_path.is_dir():
             # get every existing original files and translation files
-            abs_ignore_globs = [self.abs_glob(gi) for gi in original_ignore_globs]
-            abs_filter_globs = [self.abs_glob(gf) for gf in filter_globs]
-            abs_originals = fetch_files(abs_original_path, abs_filter_globs, abs_ignore_globs)
-            abs_translations = fetch_files(abs_translation_path, abs_filter_globs)
+            # compile patterns once for both directories
+            ignores = GlobPatterns(self.abs_glob(gi) for gi in original_ignore_globs)
+            filters = GlobPatterns(self.abs_glob(gf) for gf in filter_globs)
+            nested = abs_original_path in abs_translation_path.parents
+            if nested and not any(p.startswith(".") for p in abs_translation_path.relative_to(abs_original_path).parts):
+                # common layout with translations within original directory (e.g. docs/zh in docs): walk once
+                abs_originals, abs_translations = fetch_nested_files(abs_original_path, abs_translation_path, filters, ignores)
+            else:
+                abs_originals = fetch_files(abs_original_path, filters, ignores)
+                abs_translations = fetch_files(abs_translation_path, filters)
         else:
             log.debug("Got original path {}".format(abs_original_path))
             raise ValueError("original path is neither a file or a directory")
 
         # map translations to originals from found original paths and from found translation paths
+        original_parent = self.rel_path(abs_original_path).as_posix()
+        translation_parent = self.rel_path(abs_translation_path).as_posix()
+        # don't format a message per file when it's not logged
+        debug = log.getLogger().isEnabledFor(log.DEBUG)
         for abs_original in abs_originals:
-            original = self.rel_path(abs_original)
-            translation = replace_parent(original, original_path, translation_path)
+            original = self.rel_path(abs_original).as_posix()
+            translation = replace_parent(original, original_parent, translation_parent)
             if (translation, lang_tag) not in self.map:
                 self.map[translation, lang_tag] = original
-                log.debug("Mapped translation file '{}' from original file '{}'".format(translation, original))
+                if debug:
+                    log.debug("Mapped translation file '{}' from original file '{}'".format(translation, original))
         for abs_translation in abs_translations:
-            translation = self.rel_path(abs_translation)
+            translation = self.rel_path(abs_translation).as_posix()
             if (translation, lang_tag) not in self.map:
-                original = replace_parent(translation, translation_path, original_path)
+                original = replace_parent(translation, translation_parent, original_parent)
                 self.map[translation, lang_tag] = original
-                log.debug("Mapped translation file '{}' to original file '{}'".format(translation, original))
+                if debug:
+                    log.debug("Mapped translation file '{}' to original file '{}'".format(translation, original))
+
+    def write_commit_graph(self):
+        """
+        Writes the git commit-graph file of the repo for every reachable commit, which speeds up ancestry checks (see ``is_ancestor`` method) with generation numbers.
+
+        Changed paths Bloom filters are written as well when git supports them (git 2.27+), letting path-limited history walks (see ``last_changes`` method) skip commits not touching given paths.
+
+        Failing to write it (e.g. git older than 2.18) is not an error, git just goes on without it.
+        """
+        try:
+            self.repo.git.commit_graph('write', '--reachable', '--changed-paths')
+            return
+        except GitCommandError as e:
+            log.debug("Couldn't write git commit-graph with changed paths: {}".format(e))
+        try:
+            self.repo.git.commit_graph('write', '--reachable')
+        except GitCommandError as e:
+            log.warning("Couldn't write git commit-graph, ancestry checks may be slower.")
+            log.debug("Got git error: {}".format(e))
+
+    def is_ancestor(self, ancestor, commit):
+        """
+        Tells whether a commit is an ancestor of another commit, using ``git merge-base --is-ancestor`` (which benefits from the commit-graph).
+
+        Results are memoized by commit SHAs, as many translations share the same original changer commit.
+
+        :param ancestor: the supposed ancestor commit, or its SHA
+        :type ancestor: git.Commit or str
+        :param commit: the descendant commit, or its SHA
+        :type commit: git.Commit or str
+        :return: True if ``ancestor`` is ``commit`` or one of its ancestors, False otherwise (also when a commit is unknown)
+        :rtype: bool
+        """
+        key = tuple(c if isinstance(c, str) else c.hexsha for c in (ancestor, commit))
+        if key not in self.ancestry:
+            try:
+                self.repo.git.merge_base('--is-ancestor', *key)
+                self.ancestry[key] = True
+            except GitCommandError:
+                self.ancestry[key] = False
+        return self.ancestry[key]
+
+    def tree_blobs(self, commit):
+        """
+        Lists every file of a commit tree at once with ``git ls-tree``.
+
+        :param git.Commit commit: the commit
+        :return: object SHAs by posix path
+        :rtype: dict(str, str)
+        """
+        blobs = {}
+        for line in self.repo.git.ls_tree('-r', '-z', commit.hexsha).split('\0'):
+            if line:
+                info, path = line.split('\t', 1)
+                blobs[path] = info.split()[2]
+        return blobs
+
+    def last_changes(self, commit, paths, blobs, cache=None):
+        """
+        Finds the last commits changing several files at once, walking history with a single ``git log`` (per chunk of ``LOG_PATHS_CHUNK`` files) instead of one walk per file.
+
+        History simplification doesn't work per file when walking several files at once, so results are checked: a found commit must leave the file with its content in ``commit``.
+        Files failing the check, e.g. after some merges, are left out of the results, to be traced alone.
+
+        With a cache file (``cache_path``), history is only walked from the commit of the previous run when it is an ancestor of ``commit``.
+        Files not changed since get their cached result back, as long as they still have the cached content.
+
+        :param git.Commit commit: the commit to walk history from
+        :param paths: posix paths of the files
+        :type paths: iterable(str)
+        :param dict blobs: object SHAs by posix path of files in ``commit`` tree (see ``tree_blobs``)
+        :param dict cache: cached data already read (see ``read_cache``), updated with the results instead of writing the cache file, defaults to reading and writing the cache file
+        :return: last changer commit SHAs by posix path, None when the file has no trace
+        :rtype: dict(str, str)
+        """
+        paths = sorted(paths)
+        changes = {}
+        write = cache is None
+        if write:
+            cache = self.read_cache()
+        since = cache.get('commit')
+        if since is not None and not self.is_ancestor(since, commit.hexsha):
+            since = None
+        if since is not None:
+            rev = "{}..{}".format(since, commit.hexsha)
+            cached = cache.get('changes', {})
+            log.debug("Walking history since cached commit {}".format(since))
+        else:
+            rev = commit.hexsha
+            cached = {}
+        for i in range(0, len(paths), LOG_PATHS_CHUNK):
+            chunk = paths[i:i + LOG_PATHS_CHUNK]
+            changers = {}
+            out = self.repo.git.log('--format=%x01%H', '--raw', '-c', '--no-abbrev', '--no-renames', '-z', rev, '--', *chunk)
+            for record in out.split('\x01')[1:]:
+                sha, _, raw = record.partition('\0')
+                fields = raw.lstrip('\n').split('\0')
+                for info, path in zip(fields[::2], fields[1::2]):
+                    # a merge without combined changes has no raw line, its files are left to be traced alone
+                    if not info.startswith(':'):
+                        continue
+                    if path not in changers:
+                        changers[path] = (sha, info.split()[-2])
+            for path in chunk:
+                if path in changers:
+                    sha, blob = changers[path]
+                    if blobs.get(path, NULL_SHA) == blob:
+                        changes[path] = sha
+                elif since is not None:
+                    # unchanged since cached commit
+                    if path in cached and cached[path][1] == blobs.get(path, NULL_SHA):
+                        changes[path] = cached[path][0]
+                elif path not in blobs:
+                    changes[path] = None
+        log.debug("Found last changer commits of {} files out of {}".format(len(changes), len(paths)))
+        cache['commit'] = commit.hexsha
+        cache['changes'] = {path: [sha, blobs.get(path, NULL_SHA)] for path, sha in changes.items()}
+        if write:
+            self.write_cache(cache)
+        return changes
+
+    def read_cache(self):
+        """
+        Reads the cache file of the previous run, if any (see ``cache_path``).
+
+        An unreadable or invalid cache file is ignored.
+
+        :return: cached data, empty without cache
+        :rtype: dict
+        """
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as e:
+            log.debug("No usable tracker cache in {}: {}".format(self.cache_path, e))
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return cache
+
+    def write_cache(self, cache):
+        """
+        Writes the cache file for next runs, if set (see ``cache_path``).
+
+        :param dict cache: data to cache
+        """
+        if self.cache_path is None:
+            return
+        try:
+            write_json(self.cache_path, cache)
+        except OSError as e:
+            log.warning("Couldn't write tracker cache to {}.".format(self.cache_path))
+            log.debug("Got error: {}".format(e))
 
     def track(self):
         """
@@ -503,35 +1073,162 @@ class TranslationTracker:
         :return: created tracks, typed as subclasses of ``TranslationTrack``
         :rtype: list(TranslationTrack)
         """
-        tracks = []
-
         active_commit = self.repo.active_branch.commit
         branch_name = self.repo.active_branch.name
-        for (translation_path, lang_tag), original_path in self.map.items():
-            # SETUP file information
-            original = GitFile(original_path, active_commit)
-            translation = TranslationGitFile(translation_path, lang_tag, active_commit)
-
-            if original.no_trace and translation.no_trace:
-                # this is unexpected => some file found in put method is not in git
-                log.warning("Some path doesn't appear in git, won't treat this one.")
-                log.debug("Original file {} and translation file {} don't exist in commits. Are they in stage? Did the active HEAD changed during the script?".format(original.path, translation.path))
-                continue
-            elif original.no_trace or original.deleted_file:
-                # original file either never existed or was removed
-                track = OrphanTranslationTrack(translation, original, branch_name)
-            elif translation.no_trace or translation.deleted_file:
-                # translation file either never existed or was removed
-                track = ToCreateTranslationTrack(translation, original, branch_name)
-            elif has_tbi_header(translation.blob):
-                # translation file has the explicit To Initialize header
-                track = ToInitTranslationTrack(translation, original, branch_name)
-            elif translation.commit == original.commit or original.commit in translation.commit.iter_parents():
-                # translation is more recent than original
-                track = UpToDateTranslationTrack(translation, original, branch_name)
-            else:
-                track = ToUpdateTranslationTrack(translation, original, branch_name)
-
-            tracks.append(track)
+        # list files of the active tree once, instead of walking history for translations which don't exist
+        active_blobs = self.tree_blobs(active_commit)
+        # find last changer commits of all tracked files at once
+        paths = {original for original in self.map.values()}
+        paths.update(translation for translation, lang_tag in self.map if translation in active_blobs)
+        cache = self.read_cache()
+        history = self.last_changes(active_commit, paths, active_blobs, cache)
+        cached_headers = cache.get('headers')
+        self.cached_headers = cached_headers if isinstance(cached_headers, dict) else {}
+        self.headers = {}
+        self.lines = {}
+        # GitPython repos (and their git processes) can't be shared among threads, each worker gets its own
+        local = threading.local()
+        repos = []
+
+        def track_item(item):
+            (translation_path, lang_tag), original_path = item
+            if not hasattr(local, 'commit'):
+                repo = Repo(self.repo.working_dir)
+                repos.append(repo)
+                local.commit = repo.commit(active_commit.hexsha)
+                local.git_files = {}
+            return self.track_translation(Path(translation_path), lang_tag, Path(original_path), local.commit, branch_name, local.git_files, active_blobs, history, diff=False)
 
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                tracks = [track for track in executor.map(track_item, self.map.items()) if track is not None]
+        finally:
+            # stop the git processes of workers repos
+            for repo in repos:
+                repo.close()
+        # tracks outlive workers repos
+        for track in tracks:
+            track.translation.bind(self.repo)
+            track.original.bind(self.repo)
+            if isinstance(track, ToUpdateTranslationTrack):
+                track.base_original.bind(self.repo)
+        self.set_patches(tracks, active_commit)
+
+        self.write_cache({
+            'commit': cache['commit'],
+            'changes': cache['changes'],
+            'headers': self.headers
+        })
         return tracks
+
+    def tbi_header(self, blob):
+        """
+        Tells whether a blob has the To Initialize header (see ``has_tbi_header``), reusing the result of this run or of the previous run for the same blob SHA, without reading it.
+
+        Results are keyed by SHA rather than by blob, so that they don't keep the blob repository alive.
+
+        :param git.Blob blob: blob to read
+        :return: True if header exists as key:value in blob, False otherwise
+        :rtype: bool
+        :raise ValueError: when the blob is invalid
+        """
+        sha = blob.hexsha
+        tbi = self.headers.get(sha)
+        if tbi is None:
+            tbi = self.cached_headers.get(sha)
+        if not isinstance(tbi, bool):
+            tbi = has_tbi_header(blob)
+        self.headers[sha] = tbi
+        return tbi
+
+    def set_patches(self, tracks, commit):
+        """
+        Sets the patches of To Update tracks left without one, with one ``git diff`` per translation commit (per chunk of ``LOG_PATHS_CHUNK`` files) instead of one per track.
+
+        A base original file has the same content in the translation commit as in its last changer commit, and an original file has the same content in ``commit`` as in its last changer commit, so the patch between both commits is the same.
+        Generated diffs are checked against both blobs, tracks failing the check (e.g. renamed original files) get their patch generated alone.
+
+        :param tracks: tracks from ``commit``
+        :type tracks: list(TranslationTrack)
+        :param git.Commit commit: the commit tracks were tracked from
+        """
+        groups = {}  # key: translation commit SHA, value: tracks by original posix path
+        patches = {}  # patches generated alone (see ``cached_git_patch``)
+        for track in tracks:
+            if isinstance(track, ToUpdateTranslationTrack) and track.patch is None:
+                group = groups.setdefault(track.translation.commit.hexsha, {})
+                group.setdefault(track.original.path.as_posix(), []).append(track)
+        for by_path in groups.values():
+            base_commit = next(iter(by_path.values()))[0].translation.commit
+            paths = sorted(by_path)
+            diffs = {}
+            for i in range(0, len(paths), LOG_PATHS_CHUNK):
+                for diff in base_commit.diff(commit, paths=paths[i:i + LOG_PATHS_CHUNK], create_patch=True):
+                    diffs[diff.b_path] = diff
+            for path, path_tracks in by_path.items():
+                diff = diffs.get(path)
+                patch = None
+                for track in path_tracks:
+                    if diff is not None and diff.a_blob is not None and track.base_original.blob is not None \
+                            and diff.a_blob.binsha == track.base_original.blob.binsha and diff.b_blob.binsha == track.original.blob.binsha:
+                        if patch is None:
+                            patch = GitPatch(track.base_original, track.original, diff)
+                        track.patch = patch
+                    else:
+                        track.patch = cached_git_patch(patches, track.base_original, track.original)
+        log.debug("Generated patches of {} translation commits".format(len(groups)))
+
+    def track_translation(self, translation_path, lang_tag, original_path, active_commit, branch_name, git_files=None, active_paths=None, history=None, patches=None, diff=True):
+        """
+        Tracks a single mapped translation file against its original file (see ``track`` method).
+
+        Original files are shared between translations in several languages, hence the ``git_files`` cache.
+
+        :param pathlib.Path translation_path: the translation file path relative to git repo
+        :param str lang_tag: the language tag of the translation
+        :param pathlib.Path original_path: the original file path relative to git repo
+        :param git.Commit active_commit: the commit to track files from
+        :param str branch_name: name of the git branch where tracking is done
+        :param dict git_files: cache of git files (see ``cached_git_file``), used across calls
+        :param active_paths: posix paths of files in ``active_commit`` tree, a translation out of it is set with no trace (it is to be created either way), defaults to tracing every translation
+        :type active_paths: set(str) or dict(str, str)
+        :param dict history: last changer commits already found from ``active_commit`` (see ``GitFile``)
+        :param dict patches: cache of patches (see ``cached_git_patch``), used across calls
+        :param bool diff: whether to get the patch of a To Update track right away (see ``ToUpdateTranslationTrack``), defaults to True
+        :return: created track, or None when neither file appears in git
+        :rtype: TranslationTrack
+        """
+        if git_files is None:
+            git_files = {}
+        # SETUP file information
+        original = cached_git_file(git_files, original_path, active_commit, history)
+        trace = active_paths is None or translation_path.as_posix() in active_paths
+        translation = TranslationGitFile(translation_path, lang_tag, active_commit, trace, history)
+
+        if original.no_trace and translation.no_trace:
+            # this is unexpected => some file found in put method is not in git
+            log.warning("Some path doesn't appear in git, won't treat this one.")
+            log.debug("Original file {} and translation file {} don't exist in commits. Are they in stage? Did the active HEAD changed during the script?".format(original.path, translation.path))
+            return None
+        elif original.no_trace or original.deleted_file:
+            # original file either never existed or was removed
+            return OrphanTranslationTrack(translation, original, branch_name, self.lines)
+        elif translation.no_trace or translation.deleted_file:
+            # translation file either never existed or was removed
+            return ToCreateTranslationTrack(translation, original, branch_name, self.lines)
+        elif self.tbi_header(translation.blob):
+            # translation file has the explicit To Initialize header
+            return ToInitTranslationTrack(translation, original, branch_name, self.lines)
+        elif translation.commit == original.commit or self.is_ancestor(original.commit, translation.commit):
+            # translation is more recent than original
+            return UpToDateTranslationTrack(translation, original, branch_name)
+        else:
+            # original file changed since translation, unless it got back to the same content (e.g. reverted)
+            if original.renamed_file:
+                bo_path = original.rename_from
+            else:
+                bo_path = original.path
+            base_original = cached_git_file(git_files, bo_path, translation.commit)
+            if base_original.path == original.path and base_original.blob is not None and base_original.blob.binsha == original.blob.binsha:
+                return UpToDateTranslationTrack(translation, original, branch_name)
+            return ToUpdateTranslationTrack(translation, original, branch_name, git_files, patches, diff)